@@ -116,6 +116,9 @@ class Settings(BaseSettings):
     INGESTION_DETAIL_DELAY_SECONDS: float = Field(
         default=0.0
     )  # Optional per-detail pacing delay
+    INGESTION_DETAIL_REFRESH_HOURS: float = Field(
+        default=24.0
+    )  # Listings updated this recently get detail calls last when capped
     INGESTION_SOURCES: str = Field(default="zillow")  # Comma-separated provider list
 
     # Location Settings
@@ -29,6 +29,24 @@ if is_sqlite:
         # If URL parsing fails, let SQLAlchemy raise a clearer error downstream.
         pass
 
+
+def enable_sqlite_transactions(sqlite_engine) -> None:
+    """Let SQLAlchemy, not pysqlite, decide where SQLite transactions begin.
+
+    pysqlite never emits BEGIN before a SAVEPOINT, so without this each
+    released savepoint commits on its own. This is SQLAlchemy's documented
+    pysqlite recipe: disable the driver's implicit BEGIN and emit our own.
+    """
+
+    @event.listens_for(sqlite_engine, "connect")
+    def disable_pysqlite_begin(dbapi_conn, connection_record):
+        dbapi_conn.isolation_level = None
+
+    @event.listens_for(sqlite_engine, "begin")
+    def emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+
 engine = create_engine(database_url, echo=False, connect_args=connect_args)
 
 # Enable foreign key enforcement for SQLite (disabled by default)
@@ -42,5 +60,7 @@ if is_sqlite:
         cursor.execute("PRAGMA busy_timeout=5000")
         cursor.close()
 
+    enable_sqlite_transactions(engine)
+
 
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import JSON, Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, Index, Integer, String
 from sqlalchemy.orm import relationship
 
 from .base import Base
@@ -31,6 +31,9 @@ class ListingEvent(Base):
     """Event representing a meaningful listing change."""
 
     __tablename__ = "listing_events"
+    __table_args__ = (
+        Index("ix_listing_events_type_created", "event_type", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True)
     listing_id = Column(
@@ -1,7 +1,26 @@
 from typing import Any, Dict, Iterable, Protocol, Tuple
 
+import httpx
+
 BoundingBox = Tuple[float, float, float, float]  # lat_sw, lon_sw, lat_ne, lon_ne
 
+# Long enough to span retry backoff and the gap between search and detail calls
+PROVIDER_KEEPALIVE_SECONDS = 60.0
+
+
+def provider_http_limits(concurrency: int) -> httpx.Limits:
+    """Pool limits for a provider's long-lived httpx client.
+
+    Keeps httpx's default pool sizes (100 connections, 20 idle) as a floor,
+    with at least one idle connection per concurrency slot, and holds idle
+    connections open for PROVIDER_KEEPALIVE_SECONDS instead of 5s.
+    """
+    return httpx.Limits(
+        max_connections=max(concurrency, 100),
+        max_keepalive_connections=max(concurrency, 20),
+        keepalive_expiry=PROVIDER_KEEPALIVE_SECONDS,
+    )
+
 
 class BaseProvider(Protocol):
     """Abstract interface for real-estate data providers."""
@@ -6,6 +6,7 @@ from typing import Any, Dict, Optional
 import httpx
 
 from app.core.config import settings
+from app.providers.base import provider_http_limits
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +29,11 @@ class ZenRowsUniversalClient:
         timeout_seconds = (
             timeout if timeout is not None else settings.ZENROWS_TIMEOUT_SECONDS
         )
-        self._client = httpx.AsyncClient(timeout=timeout_seconds)
+        # Every request goes to the same ZenRows host; keep warm connections
+        # so pages and detail calls skip TCP/TLS setup.
+        self._client = httpx.AsyncClient(
+            timeout=timeout_seconds, limits=provider_http_limits(concurrency)
+        )
         self._sem = asyncio.Semaphore(concurrency)
         self._max_retries = max_retries
 
@@ -9,7 +9,7 @@ import httpx
 
 from app.core.config import settings
 
-from .base import BaseProvider
+from .base import BaseProvider, provider_http_limits
 
 # from bs4 import BeautifulSoup # No longer needed if we only parse JSON
 
@@ -101,7 +101,10 @@ class ZillowProvider(BaseProvider):
             self.property_types = property_types or ["apartment", "condo", "townhouse"]
         else:
             self.property_types = property_types or ["single-family", "condo", "townhouse"]
-        self.client = httpx.AsyncClient(timeout=settings.ZENROWS_TIMEOUT_SECONDS)
+        self.client = httpx.AsyncClient(
+            timeout=settings.ZENROWS_TIMEOUT_SECONDS,
+            limits=provider_http_limits(concurrency),
+        )
         self.sem = asyncio.Semaphore(concurrency)
 
         # Log the configured search parameters
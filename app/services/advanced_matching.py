@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from sqlalchemy import and_, or_, select
+from sqlalchemy import and_, func, or_, select
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
@@ -15,9 +15,10 @@ from app.services.criteria_config import (BuyerCriteria,
                                           get_required_neighborhoods,
                                           load_buyer_criteria)
 from app.services.geospatial import (apply_location_modifiers,
-                                     calculate_tranquility_score)
+                                     score_tranquility)
 from app.services.nlp import (analyze_text_signals, estimate_light_potential,
                               is_generic_description)
+from app.services.persistence import PREFETCH_CHUNK_SIZE
 from app.services.scoring.primitives import (CENTRAL_HVAC_KEYWORDS,
                                              CRITERION_LABELS,
                                              DISHWASHER_KEYWORDS,
@@ -61,7 +62,42 @@ NEGATED_DOORMAN_PHRASES = [
 ]
 
 
-def _build_why_now(listing: PropertyListing, db: Session) -> Optional[str]:
+def _latest_events_by_listing(
+    db: Session, listing_ids: List[int]
+) -> Dict[int, ListingEvent]:
+    """Newest event per listing, loaded in bounded IN-list chunks."""
+    latest: Dict[int, ListingEvent] = {}
+    listing_ids = list(listing_ids)
+    for start in range(0, len(listing_ids), PREFETCH_CHUNK_SIZE):
+        chunk = listing_ids[start : start + PREFETCH_CHUNK_SIZE]
+        ranked = (
+            select(
+                ListingEvent.id,
+                func.row_number()
+                .over(
+                    partition_by=ListingEvent.listing_id,
+                    order_by=(ListingEvent.created_at.desc(), ListingEvent.id.desc()),
+                )
+                .label("recency"),
+            )
+            .where(ListingEvent.listing_id.in_(chunk))
+            .subquery()
+        )
+        events = (
+            db.query(ListingEvent)
+            .join(ranked, ranked.c.id == ListingEvent.id)
+            .filter(ranked.c.recency == 1)
+        )
+        for event in events:
+            latest[event.listing_id] = event
+    return latest
+
+
+def _build_why_now(
+    listing: PropertyListing,
+    db: Session,
+    latest_events: Optional[Dict[int, ListingEvent]] = None,
+) -> Optional[str]:
     if listing.is_price_reduced and listing.price_reduction_amount:
         if listing.price:
             percent = (
@@ -71,12 +107,15 @@ def _build_why_now(listing: PropertyListing, db: Session) -> Optional[str]:
             return f"Price dropped {percent:.0f}% recently"
         return "Price dropped recently"
 
-    recent_event = (
-        db.query(ListingEvent)
-        .filter(ListingEvent.listing_id == listing.id)
-        .order_by(ListingEvent.created_at.desc())
-        .first()
-    )
+    if latest_events is not None:
+        recent_event = latest_events.get(listing.id)
+    else:
+        recent_event = (
+            db.query(ListingEvent)
+            .filter(ListingEvent.listing_id == listing.id)
+            .order_by(ListingEvent.created_at.desc(), ListingEvent.id.desc())
+            .first()
+        )
     if recent_event:
         if recent_event.event_type == "price_drop":
             details = recent_event.details or {}
@@ -133,9 +172,7 @@ class PropertyMatcher:
             and listing.lat
             and listing.lon
         ):
-            tranquility_score = calculate_tranquility_score(
-                listing.lat, listing.lon
-            ).get("score")
+            tranquility_score = score_tranquility(listing.lat, listing.lon).score
             listing.tranquility_score = tranquility_score
 
         return description, text_lower, nlp_hits, tranquility_score
@@ -277,6 +314,7 @@ class PropertyMatcher:
         signals: MatchSignals,
         total_possible: float,
         score_percent_value: float,
+        latest_events: Optional[Dict[int, ListingEvent]] = None,
     ) -> None:
         contributions = [
             (key, (comp.score / 10.0) * comp.weight)
@@ -305,7 +343,7 @@ class PropertyMatcher:
                 lowest = min(weighted_components, key=lambda item: item[1].score)
                 tradeoff = f"Low on {CRITERION_LABELS.get(lowest[0], lowest[0])}"
 
-        why_now = _build_why_now(listing, self.db)
+        why_now = _build_why_now(listing, self.db, latest_events)
 
         listing.match_score = round(score_percent_value, 1)
         listing.score_points = round(total_points, 1)
@@ -359,8 +397,7 @@ class PropertyMatcher:
             and listing.lon
             and self.include_intelligence
         ):
-            tranquility = calculate_tranquility_score(listing.lat, listing.lon)
-            tranquility_score = tranquility.get("score")
+            tranquility_score = score_tranquility(listing.lat, listing.lon).score
 
         visual_brightness = None
         if listing.visual_assessment:
@@ -902,14 +939,16 @@ class PropertyMatcher:
 
         return total, components, signals
 
-    def score_listing(
-        self, listing: PropertyListing, min_score_percent: float = 0.0
-    ) -> bool:
+    def _scorecard_percent(
+        self,
+        listing: PropertyListing,
+        latest_events: Optional[Dict[int, ListingEvent]] = None,
+    ) -> Optional[float]:
         total_possible = self._total_possible_points()
 
         passes, _ = self._passes_hard_filters(listing)
         if not passes:
-            return False
+            return None
 
         description, text_lower, nlp_hits, tranquility_score = (
             self._build_listing_context(listing)
@@ -919,7 +958,7 @@ class PropertyMatcher:
             listing, text_lower, nlp_hits, tranquility_score
         )
         if not passes:
-            return False
+            return None
 
         total_points, components, signals = self._score_listing(
             listing, nlp_hits, text_lower
@@ -932,9 +971,36 @@ class PropertyMatcher:
             signals,
             total_possible,
             score_percent_value,
+            latest_events,
+        )
+        return score_percent_value
+
+    def score_listing(
+        self, listing: PropertyListing, min_score_percent: float = 0.0
+    ) -> bool:
+        score_percent_value = self._scorecard_percent(listing)
+        return (
+            score_percent_value is not None and score_percent_value >= min_score_percent
         )
 
-        return score_percent_value >= min_score_percent
+    def score_listings(
+        self, listings: Iterable[PropertyListing]
+    ) -> Dict[int, Optional[float]]:
+        """Score many listings at once, keyed by listing id.
+
+        Each listing gets its scorecard applied exactly as score_listing
+        would, and maps to its score percent, or None if it fails a hard
+        filter. The latest events behind why_now are loaded in one query
+        rather than one per listing.
+        """
+        listings = list(listings)
+        latest_events = _latest_events_by_listing(
+            self.db, [listing.id for listing in listings]
+        )
+        return {
+            listing.id: self._scorecard_percent(listing, latest_events)
+            for listing in listings
+        }
 
     def find_matches(
         self,
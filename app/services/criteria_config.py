@@ -36,9 +36,12 @@ def _as_dict(value: Any) -> Dict[str, Any]:
     return value if isinstance(value, dict) else {}
 
 
-@lru_cache(maxsize=1)
-def load_buyer_criteria(path: Optional[str] = None) -> BuyerCriteria:
-    criteria_path = Path(path or settings.BUYER_CRITERIA_PATH)
+# Room for a few criteria files (e.g. tests alternating paths); stale
+# entries left behind by file edits simply age out
+@lru_cache(maxsize=8)
+def _parse_buyer_criteria(
+    criteria_path: Path, mtime_ns: Optional[int]
+) -> BuyerCriteria:
     data = _load_yaml(criteria_path)
 
     return BuyerCriteria(
@@ -53,6 +56,26 @@ def load_buyer_criteria(path: Optional[str] = None) -> BuyerCriteria:
     )
 
 
+def load_buyer_criteria(path: Optional[str] = None) -> BuyerCriteria:
+    """Return the parsed criteria, re-reading the YAML only when it changes.
+
+    The cache is keyed on the resolved path and its mtime, so a stat call is
+    all a repeat load costs and edits to the file are picked up without a
+    restart.
+    """
+    criteria_path = Path(path or settings.BUYER_CRITERIA_PATH)
+    try:
+        mtime_ns: Optional[int] = criteria_path.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    return _parse_buyer_criteria(criteria_path, mtime_ns)
+
+
+def clear_buyer_criteria_cache() -> None:
+    """Drop every cached criteria parse, forcing the next load to re-read."""
+    _parse_buyer_criteria.cache_clear()
+
+
 def get_required_neighborhoods(criteria: BuyerCriteria) -> List[str]:
     neighborhoods = criteria.hard_filters.get("neighborhoods") or []
     return [n for n in neighborhoods if isinstance(n, str)]
@@ -7,17 +7,25 @@ No external APIs required - uses static datasets for SF and NYC noise sources.
 
 import math
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
 
+import numpy as np
 
-@dataclass
+EARTH_RADIUS_M = 6371000  # Earth's radius in meters
+
+Envelope = Tuple[float, float, float, float]  # lat_min, lat_max, lon_min, lon_max
+
+SF_BOUNDS: Envelope = (37.707, 37.83, -122.515, -122.355)
+NYC_BOUNDS: Envelope = (40.62, 40.80, -74.05, -73.90)
+
+
+@dataclass(frozen=True, slots=True)
 class NoiseSource:
     """Represents a noise source with location and severity."""
 
     name: str
-    coords: List[
-        Tuple[float, float]
-    ]  # List of (lat, lon) points defining the line/area
+    coords: Tuple[Tuple[float, float], ...]  # (lat, lon) points defining the line/area
     severity: float  # 0.0 to 1.0, higher = noisier
     source_type: str  # 'street', 'freeway', 'transit', 'venue'
 
@@ -29,61 +37,61 @@ class NoiseSource:
 SF_BUSY_STREETS = [
     NoiseSource(
         name="Van Ness Ave",
-        coords=[(37.7949, -122.4217), (37.7549, -122.4217)],
+        coords=((37.7949, -122.4217), (37.7549, -122.4217)),
         severity=0.9,
         source_type="street",
     ),
     NoiseSource(
         name="Geary Blvd",
-        coords=[(37.7852, -122.5034), (37.7852, -122.4034)],
+        coords=((37.7852, -122.5034), (37.7852, -122.4034)),
         severity=0.85,
         source_type="street",
     ),
     NoiseSource(
         name="19th Avenue",
-        coords=[(37.7815, -122.4759), (37.7215, -122.4759)],
+        coords=((37.7815, -122.4759), (37.7215, -122.4759)),
         severity=0.85,
         source_type="street",
     ),
     NoiseSource(
         name="Mission Street",
-        coords=[(37.7649, -122.4198), (37.7849, -122.4048)],
+        coords=((37.7649, -122.4198), (37.7849, -122.4048)),
         severity=0.75,
         source_type="street",
     ),
     NoiseSource(
         name="Market Street",
-        coords=[(37.7879, -122.4074), (37.7649, -122.4352)],
+        coords=((37.7879, -122.4074), (37.7649, -122.4352)),
         severity=0.8,
         source_type="street",
     ),
     NoiseSource(
         name="Divisadero Street",
-        coords=[(37.7849, -122.4399), (37.7449, -122.4399)],
+        coords=((37.7849, -122.4399), (37.7449, -122.4399)),
         severity=0.65,
         source_type="street",
     ),
     NoiseSource(
         name="Lombard Street (Marina)",
-        coords=[(37.8005, -122.4185), (37.8005, -122.4485)],
+        coords=((37.8005, -122.4185), (37.8005, -122.4485)),
         severity=0.7,
         source_type="street",
     ),
     NoiseSource(
         name="Columbus Avenue",
-        coords=[(37.7987, -122.4078), (37.8057, -122.4178)],
+        coords=((37.7987, -122.4078), (37.8057, -122.4178)),
         severity=0.65,
         source_type="street",
     ),
     NoiseSource(
         name="Folsom Street",
-        coords=[(37.7799, -122.4058), (37.7639, -122.4198)],
+        coords=((37.7799, -122.4058), (37.7639, -122.4198)),
         severity=0.6,
         source_type="street",
     ),
     NoiseSource(
         name="Broadway",
-        coords=[(37.7977, -122.4058), (37.7977, -122.4258)],
+        coords=((37.7977, -122.4058), (37.7977, -122.4258)),
         severity=0.7,
         source_type="street",
     ),
@@ -92,19 +100,19 @@ SF_BUSY_STREETS = [
 SF_FREEWAYS = [
     NoiseSource(
         name="US-101 (Central)",
-        coords=[(37.7749, -122.4094), (37.7649, -122.3994), (37.7549, -122.3894)],
+        coords=((37.7749, -122.4094), (37.7649, -122.3994), (37.7549, -122.3894)),
         severity=1.0,
         source_type="freeway",
     ),
     NoiseSource(
         name="I-280",
-        coords=[(37.7349, -122.4094), (37.7249, -122.4194), (37.7149, -122.4294)],
+        coords=((37.7349, -122.4094), (37.7249, -122.4194), (37.7149, -122.4294)),
         severity=0.95,
         source_type="freeway",
     ),
     NoiseSource(
         name="I-80 (Bay Bridge approach)",
-        coords=[(37.7879, -122.3894), (37.7879, -122.3794)],
+        coords=((37.7879, -122.3894), (37.7879, -122.3794)),
         severity=0.95,
         source_type="freeway",
     ),
@@ -130,49 +138,49 @@ SF_FIRE_STATIONS = [
 NYC_BUSY_STREETS = [
     NoiseSource(
         name="Broadway (Manhattan)",
-        coords=[(40.7061, -74.0131), (40.7580, -73.9855), (40.7831, -73.9712)],
+        coords=((40.7061, -74.0131), (40.7580, -73.9855), (40.7831, -73.9712)),
         severity=0.85,
         source_type="street",
     ),
     NoiseSource(
         name="Canal Street",
-        coords=[(40.7195, -74.0066), (40.7166, -73.9982), (40.7149, -73.9909)],
+        coords=((40.7195, -74.0066), (40.7166, -73.9982), (40.7149, -73.9909)),
         severity=0.9,
         source_type="street",
     ),
     NoiseSource(
         name="Houston Street",
-        coords=[(40.7268, -74.0078), (40.7227, -73.9952), (40.7209, -73.9828)],
+        coords=((40.7268, -74.0078), (40.7227, -73.9952), (40.7209, -73.9828)),
         severity=0.8,
         source_type="street",
     ),
     NoiseSource(
         name="Bowery",
-        coords=[(40.7149, -73.9974), (40.7242, -73.9927), (40.7316, -73.9892)],
+        coords=((40.7149, -73.9974), (40.7242, -73.9927), (40.7316, -73.9892)),
         severity=0.75,
         source_type="street",
     ),
     NoiseSource(
         name="Delancey Street",
-        coords=[(40.7188, -73.9989), (40.7178, -73.9878), (40.7148, -73.9778)],
+        coords=((40.7188, -73.9989), (40.7178, -73.9878), (40.7148, -73.9778)),
         severity=0.85,
         source_type="street",
     ),
     NoiseSource(
         name="Flatbush Avenue",
-        coords=[(40.6905, -73.9764), (40.6832, -73.9773), (40.6705, -73.9631)],
+        coords=((40.6905, -73.9764), (40.6832, -73.9773), (40.6705, -73.9631)),
         severity=0.8,
         source_type="street",
     ),
     NoiseSource(
         name="Atlantic Avenue (Brooklyn)",
-        coords=[(40.6863, -73.9781), (40.6848, -73.9685), (40.6822, -73.9549)],
+        coords=((40.6863, -73.9781), (40.6848, -73.9685), (40.6822, -73.9549)),
         severity=0.75,
         source_type="street",
     ),
     NoiseSource(
         name="4th Avenue (Brooklyn)",
-        coords=[(40.6863, -73.9781), (40.6746, -73.9831), (40.6656, -73.9880)],
+        coords=((40.6863, -73.9781), (40.6746, -73.9831), (40.6656, -73.9880)),
         severity=0.7,
         source_type="street",
     ),
@@ -181,19 +189,19 @@ NYC_BUSY_STREETS = [
 NYC_FREEWAYS = [
     NoiseSource(
         name="BQE (Brooklyn-Queens Expressway)",
-        coords=[
+        coords=(
             (40.6891, -73.9979), (40.6938, -73.9923), (40.6996, -73.9862),
             (40.7024, -73.9847),
-        ],
+        ),
         severity=1.0,
         source_type="freeway",
     ),
     NoiseSource(
         name="FDR Drive",
-        coords=[
+        coords=(
             (40.7096, -73.9752), (40.7210, -73.9740), (40.7350, -73.9730),
             (40.7550, -73.9660),
-        ],
+        ),
         severity=0.95,
         source_type="freeway",
     ),
@@ -213,7 +221,8 @@ NYC_FIRE_STATIONS = [
 
 def _is_in_nyc(lat: float, lon: float) -> bool:
     """Check if coordinates fall within the NYC coverage bounding box."""
-    return 40.62 <= lat <= 40.80 and -74.05 <= lon <= -73.90
+    lat_min, lat_max, lon_min, lon_max = NYC_BOUNDS
+    return lat_min <= lat <= lat_max and lon_min <= lon <= lon_max
 
 
 # =============================================================================
@@ -226,7 +235,7 @@ def haversine_meters(lat1: float, lon1: float, lat2: float, lon2: float) -> floa
     Calculate the great-circle distance in meters between two points.
     Uses the Haversine formula.
     """
-    R = 6371000  # Earth's radius in meters
+    R = EARTH_RADIUS_M
 
     phi1 = math.radians(lat1)
     phi2 = math.radians(lat2)
@@ -237,11 +246,25 @@ def haversine_meters(lat1: float, lon1: float, lat2: float, lon2: float) -> floa
         math.sin(delta_phi / 2) ** 2
         + math.cos(phi1) * math.cos(phi2) * math.sin(delta_lambda / 2) ** 2
     )
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+    # asin form; min() guards rounding past 1 for near-antipodal points
+    c = 2 * math.asin(min(1.0, math.sqrt(a)))
 
     return R * c
 
 
+def _haversine_precomp(
+    lat1: float, lon1: float, cos_phi1: float, lat2: float, lon2: float
+) -> float:
+    """haversine_meters with cos(radians(lat1)) supplied by the caller."""
+    a = (
+        math.sin(math.radians(lat2 - lat1) / 2) ** 2
+        + cos_phi1
+        * math.cos(math.radians(lat2))
+        * math.sin(math.radians(lon2 - lon1) / 2) ** 2
+    )
+    return EARTH_RADIUS_M * 2 * math.asin(min(1.0, math.sqrt(a)))
+
+
 def point_to_segment_distance(
     point_lat: float,
     point_lon: float,
@@ -249,13 +272,19 @@ def point_to_segment_distance(
     seg_lon1: float,
     seg_lat2: float,
     seg_lon2: float,
+    cos_phi1: Optional[float] = None,
 ) -> float:
     """
     Calculate the minimum distance from a point to a line segment.
     Returns distance in meters.
 
     Uses projection onto the line segment to find the closest point.
+    Callers measuring one point against many segments can pass
+    cos_phi1 = cos(radians(point_lat)) to skip recomputing it each time.
     """
+    if cos_phi1 is None:
+        cos_phi1 = math.cos(math.radians(point_lat))
+
     # Vector from segment start to point
     px = point_lon - seg_lon1
     py = point_lat - seg_lat1
@@ -269,7 +298,7 @@ def point_to_segment_distance(
 
     if seg_len_sq == 0:
         # Segment is a point
-        return haversine_meters(point_lat, point_lon, seg_lat1, seg_lon1)
+        return _haversine_precomp(point_lat, point_lon, cos_phi1, seg_lat1, seg_lon1)
 
     # Project point onto segment line, clamped to [0, 1]
     t = max(0, min(1, (px * sx + py * sy) / seg_len_sq))
@@ -278,11 +307,11 @@ def point_to_segment_distance(
     closest_lon = seg_lon1 + t * sx
     closest_lat = seg_lat1 + t * sy
 
-    return haversine_meters(point_lat, point_lon, closest_lat, closest_lon)
+    return _haversine_precomp(point_lat, point_lon, cos_phi1, closest_lat, closest_lon)
 
 
 def distance_to_polyline(
-    point_lat: float, point_lon: float, coords: List[Tuple[float, float]]
+    point_lat: float, point_lon: float, coords: Sequence[Tuple[float, float]]
 ) -> float:
     """
     Calculate minimum distance from a point to a polyline (series of segments).
@@ -293,164 +322,615 @@ def distance_to_polyline(
             return haversine_meters(point_lat, point_lon, coords[0][0], coords[0][1])
         return float("inf")
 
+    cos_phi1 = math.cos(math.radians(point_lat))
     min_dist = float("inf")
-    for i in range(len(coords) - 1):
+    lat1, lon1 = coords[0]
+    for lat2, lon2 in coords[1:]:
         dist = point_to_segment_distance(
-            point_lat,
-            point_lon,
-            coords[i][0],
-            coords[i][1],
-            coords[i + 1][0],
-            coords[i + 1][1],
+            point_lat, point_lon, lat1, lon1, lat2, lon2, cos_phi1
         )
-        min_dist = min(min_dist, dist)
+        if dist < min_dist:
+            min_dist = dist
+        lat1, lon1 = lat2, lon2
 
     return min_dist
 
 
-# =============================================================================
-# TRANQUILITY SCORE CALCULATION
-# =============================================================================
-
-
 def _is_in_sf(lat: float, lon: float) -> bool:
     """Check if coordinates fall within the San Francisco bounding box."""
-    return 37.707 <= lat <= 37.83 and -122.515 <= lon <= -122.355
+    lat_min, lat_max, lon_min, lon_max = SF_BOUNDS
+    return lat_min <= lat <= lat_max and lon_min <= lon <= lon_max
 
 
-def calculate_tranquility_score(lat: Optional[float], lon: Optional[float]) -> Dict:
+# Beyond these distances the source no longer changes the score
+FREEWAY_NOISE_RADIUS_M = 500
+FIRE_STATION_NOISE_RADIUS_M = 300
+
+
+class SegmentTable(NamedTuple):
     """
-    Calculate a Tranquility Score (0-100) based on proximity to noise sources.
+    Every segment of a group of polylines, flattened into parallel arrays.
 
-    Higher score = quieter location. Covers SF and NYC noise sources.
-    Returns None score for locations outside both coverage areas.
+    Segments are stored in source order; owner maps each one back to its
+    index in the original sequence. A single-point polyline is stored as a
+    zero-length segment (len_sq == 0), which is how point sources such as
+    fire stations share the same tables and scan.
+    """
 
-    Returns:
-        {
-            "score": int (0-100) or None,
-            "factors": {
-                "nearest_busy_street": {"name": str, "distance_m": float},
-                "nearest_freeway": {"name": str, "distance_m": float},
-                "nearest_fire_station": {"name": str, "distance_m": float},
-            },
-            "warnings": List[str],
-            "confidence": str ("high" | "medium" | "low")
-        }
+    sources: Sequence[Any]  # NoiseSources, or station dicts for point tables
+    lat1: np.ndarray
+    lon1: np.ndarray
+    dlat: np.ndarray  # lat2 - lat1
+    dlon: np.ndarray  # lon2 - lon1
+    len_sq: np.ndarray  # dlat**2 + dlon**2, in squared degrees
+    owner: np.ndarray
+    # The same segments as Python floats in radians for single-point scans,
+    # where per-call NumPy overhead outweighs a handful of segments:
+    # (phi1, lam1, dphi, dlam, len_sq, owner, phi_lo, phi_hi, lam_lo, lam_hi),
+    # ending with the segment's bounding box.
+    rows: Tuple[Tuple[Any, ...], ...]
+    max_abs_phi: float  # poleward-most latitude of any endpoint, in radians
+
+
+def _segment_table(
+    sources: Sequence[Any],
+    polylines: Optional[Sequence[Sequence[Tuple[float, float]]]] = None,
+) -> SegmentTable:
+    """Flatten sources into a SegmentTable; polylines default to source.coords."""
+    if polylines is None:
+        polylines = [source.coords for source in sources]
+
+    lat1: List[float] = []
+    lon1: List[float] = []
+    lat2: List[float] = []
+    lon2: List[float] = []
+    owner: List[int] = []
+    for idx, coords in enumerate(polylines):
+        pairs = zip(coords, coords[1:]) if len(coords) > 1 else zip(coords, coords)
+        for (a_lat, a_lon), (b_lat, b_lon) in pairs:
+            lat1.append(a_lat)
+            lon1.append(a_lon)
+            lat2.append(b_lat)
+            lon2.append(b_lon)
+            owner.append(idx)
+
+    seg_lat1 = np.asarray(lat1, dtype=np.float64)
+    seg_lon1 = np.asarray(lon1, dtype=np.float64)
+    dlat = np.asarray(lat2, dtype=np.float64) - seg_lat1
+    dlon = np.asarray(lon2, dtype=np.float64) - seg_lon1
+    len_sq = dlon * dlon + dlat * dlat
+
+    phi1 = np.radians(seg_lat1)
+    lam1 = np.radians(seg_lon1)
+    phi2 = np.radians(np.asarray(lat2, dtype=np.float64))
+    lam2 = np.radians(np.asarray(lon2, dtype=np.float64))
+    dphi = phi2 - phi1
+    dlam = lam2 - lam1
+    return SegmentTable(
+        sources=sources,
+        lat1=seg_lat1,
+        lon1=seg_lon1,
+        dlat=dlat,
+        dlon=dlon,
+        len_sq=len_sq,
+        owner=np.asarray(owner, dtype=np.intp),
+        rows=tuple(
+            zip(
+                phi1.tolist(),
+                lam1.tolist(),
+                dphi.tolist(),
+                dlam.tolist(),
+                (dlam * dlam + dphi * dphi).tolist(),
+                owner,
+                np.minimum(phi1, phi2).tolist(),
+                np.maximum(phi1, phi2).tolist(),
+                np.minimum(lam1, lam2).tolist(),
+                np.maximum(lam1, lam2).tolist(),
+            )
+        ),
+        max_abs_phi=float(np.abs(np.concatenate([phi1, phi2])).max(initial=0.0)),
+    )
+
+
+def _nearest_segment(
+    point_lat: float,
+    point_lon: float,
+    table: SegmentTable,
+    within_m: float = float("inf"),
+) -> Tuple[float, Any]:
     """
+    Return (distance in meters, source) for the closest segment in a table.
+
+    Same projection and haversine as point_to_segment_distance, inlined over
+    the flattened segments of every source so the hot loop makes no Python
+    function calls beyond the math builtins. Segment rows are stored in
+    radians and the point is converted once, so no per-segment degree
+    conversion is needed. Only segments strictly closer than within_m are
+    considered; (inf, None) means none qualified.
+    """
+    sin, cos, asin, sqrt = math.sin, math.cos, math.asin, math.sqrt
+
+    # The point's side of the haversine is the same for every segment
+    phi = math.radians(point_lat)
+    lam = math.radians(point_lon)
+    cos_phi = cos(phi)
+
+    # Segments are pre-screened by an equirectangular distance to their
+    # bounding box, measured at the poleward-most latitude involved and
+    # shrunk by 1%, which keeps it a lower bound on the haversine at city
+    # scale. A segment whose bound cannot beat the best distance so far is
+    # skipped without any trig, so the result is unchanged.
+    lam_scale = cos(max(abs(phi), table.max_abs_phi))
+    min_dist = within_m
+    skip_rad = min_dist / (0.99 * EARTH_RADIUS_M)
+    skip_sq = skip_rad * skip_rad
+
+    nearest = -1
+    for row in table.rows:
+        phi1, lam1, dphi, dlam, len_sq, owner, phi_lo, phi_hi, lam_lo, lam_hi = row
+        if phi < phi_lo:
+            gap_phi = phi_lo - phi
+        elif phi > phi_hi:
+            gap_phi = phi - phi_hi
+        else:
+            gap_phi = 0.0
+        if lam < lam_lo:
+            gap_lam = (lam_lo - lam) * lam_scale
+        elif lam > lam_hi:
+            gap_lam = (lam - lam_hi) * lam_scale
+        else:
+            gap_lam = 0.0
+        if gap_phi * gap_phi + gap_lam * gap_lam >= skip_sq:
+            continue
+
+        # Projection is scale-invariant, so it is the same in radians as in
+        # the degrees point_to_segment_distance works in
+        if len_sq == 0:
+            t = 0.0
+        else:
+            t = ((lam - lam1) * dlam + (phi - phi1) * dphi) / len_sq
+            if t < 0:
+                t = 0
+            elif t > 1:
+                t = 1
+        closest_phi = phi1 + t * dphi
+
+        a = (
+            sin((closest_phi - phi) / 2) ** 2
+            + cos_phi * cos(closest_phi) * sin((lam1 + t * dlam - lam) / 2) ** 2
+        )
+        # Point and segments share a city, so a stays far below 1 and the
+        # min(1.0, ...) guard in haversine_meters is not needed here.
+        dist = EARTH_RADIUS_M * (2 * asin(sqrt(a)))
+        if dist < min_dist:
+            min_dist = dist
+            nearest = owner
+            skip_rad = min_dist / (0.99 * EARTH_RADIUS_M)
+            skip_sq = skip_rad * skip_rad
+    if nearest < 0:
+        return float("inf"), None
+    return min_dist, table.sources[nearest]
+
+
+@dataclass(frozen=True)
+class CityNoise:
+    """A city's noise sources plus the lookup structures derived from them."""
+
+    busy_streets: Sequence[NoiseSource]
+    freeways: Sequence[NoiseSource]
+    fire_stations: Sequence[Dict[str, Any]]
+    street_segments: SegmentTable
+    freeway_segments: SegmentTable
+    fire_station_points: SegmentTable
+
+
+def _build_city_noise(
+    busy_streets: Sequence[NoiseSource],
+    freeways: Sequence[NoiseSource],
+    fire_stations: Sequence[Dict[str, Any]],
+) -> CityNoise:
+    return CityNoise(
+        busy_streets=busy_streets,
+        freeways=freeways,
+        fire_stations=fire_stations,
+        street_segments=_segment_table(busy_streets),
+        freeway_segments=_segment_table(freeways),
+        fire_station_points=_segment_table(
+            fire_stations, [((s["lat"], s["lon"]),) for s in fire_stations]
+        ),
+    )
+
+
+# Derived lookup data is built on first use, so a worker that only ever
+# scores one city never pays for the other.
+@lru_cache(maxsize=1)
+def _sf_noise() -> CityNoise:
+    return _build_city_noise(SF_BUSY_STREETS, SF_FREEWAYS, SF_FIRE_STATIONS)
+
+
+@lru_cache(maxsize=1)
+def _nyc_noise() -> CityNoise:
+    return _build_city_noise(NYC_BUSY_STREETS, NYC_FREEWAYS, NYC_FIRE_STATIONS)
+
+
+def _city_noise(lat: float, lon: float) -> Optional[CityNoise]:
+    """Return the noise data for the city covering (lat, lon), if any."""
+    if _is_in_sf(lat, lon):
+        return _sf_noise()
+    if _is_in_nyc(lat, lon):
+        return _nyc_noise()
+    return None
+
+
+class TranquilityResult(NamedTuple):
+    """
+    Raw tranquility outcome for one point.
+
+    Holds references to the nearest sources rather than formatted strings so
+    score-only callers skip the factor/warning dict work; format_tranquility
+    builds the API payload when it is actually needed.
+    """
+
+    score: Optional[int]
+    confidence: str
+    nearest_street: Optional[NoiseSource] = None
+    street_distance_m: float = float("inf")
+    nearest_freeway: Optional[NoiseSource] = None
+    freeway_distance_m: float = float("inf")
+    nearest_fire_station: Optional[Dict[str, Any]] = None
+    fire_station_distance_m: float = float("inf")
+    note: Optional[str] = None  # Set when the point could not be scored
+
+
+# Coordinates are snapped to 4 decimal places (~11m) before scoring, so
+# listings on the same block share one cached result.
+TRANQUILITY_GRID_DECIMALS = 4
+
+
+def score_tranquility(lat: Optional[float], lon: Optional[float]) -> TranquilityResult:
+    """Compute the tranquility score without building the factors payload."""
     if lat is None or lon is None:
-        return {
-            "score": 50,  # Neutral if no data
-            "factors": {},
-            "warnings": ["No location data available"],
-            "confidence": "low",
-        }
+        # Neutral if no data
+        return TranquilityResult(
+            score=50, confidence="low", note="No location data available"
+        )
 
+    return _score_tranquility_cell(
+        round(lat, TRANQUILITY_GRID_DECIMALS), round(lon, TRANQUILITY_GRID_DECIMALS)
+    )
+
+
+@lru_cache(maxsize=4096)
+def _score_tranquility_cell(lat: float, lon: float) -> TranquilityResult:
     # Select city-specific noise data
-    if _is_in_sf(lat, lon):
-        busy_streets = SF_BUSY_STREETS
-        freeways = SF_FREEWAYS
-        fire_stations = SF_FIRE_STATIONS
-    elif _is_in_nyc(lat, lon):
-        busy_streets = NYC_BUSY_STREETS
-        freeways = NYC_FREEWAYS
-        fire_stations = NYC_FIRE_STATIONS
-    else:
-        return {
-            "score": None,
-            "factors": {},
-            "warnings": ["Outside coverage area"],
-            "confidence": "low",
-        }
+    city = _city_noise(lat, lon)
+    if city is None:
+        return TranquilityResult(
+            score=None, confidence="low", note="Outside coverage area"
+        )
 
     score = 100.0
-    factors = {}
-    warnings = []
 
     # Check busy street proximity
-    min_street_dist = float("inf")
-    nearest_street = None
-    for street in busy_streets:
-        dist = distance_to_polyline(lat, lon, street.coords)
-        if dist < min_street_dist:
-            min_street_dist = dist
-            nearest_street = street
-
-    factors["nearest_busy_street"] = {
-        "name": nearest_street.name if nearest_street else "Unknown",
-        "distance_m": round(min_street_dist, 1),
-    }
+    min_street_dist, nearest_street = _nearest_segment(lat, lon, city.street_segments)
 
     # Deduct for busy street proximity (weighted by severity)
     if nearest_street:
         severity = nearest_street.severity
         if min_street_dist < 30:  # On the street
             score -= 35 * severity
-            warnings.append(f"On {nearest_street.name} (high traffic)")
         elif min_street_dist < 75:  # ~1/2 block
             score -= 25 * severity
-            warnings.append(f"Near {nearest_street.name}")
         elif min_street_dist < 150:  # ~1 block
             score -= 15 * severity
         elif min_street_dist < 300:  # ~2 blocks
             score -= 8 * severity
 
-    # Check freeway proximity (severe penalty)
-    min_freeway_dist = float("inf")
-    nearest_freeway = None
-    for freeway in freeways:
-        dist = distance_to_polyline(lat, lon, freeway.coords)
-        if dist < min_freeway_dist:
-            min_freeway_dist = dist
-            nearest_freeway = freeway
-
-    factors["nearest_freeway"] = {
-        "name": nearest_freeway.name if nearest_freeway else "None nearby",
-        "distance_m": round(min_freeway_dist, 1),
-    }
+    # Check freeway proximity (severe penalty). The nearest freeway is always
+    # reported; it only changes the score inside the penalty radius.
+    min_freeway_dist, nearest_freeway = _nearest_segment(
+        lat, lon, city.freeway_segments
+    )
 
-    if nearest_freeway and min_freeway_dist < 500:
+    if nearest_freeway and min_freeway_dist < FREEWAY_NOISE_RADIUS_M:
         if min_freeway_dist < 100:
             score -= 40
-            warnings.append(f"Adjacent to {nearest_freeway.name}")
         elif min_freeway_dist < 200:
             score -= 30
-            warnings.append(f"Very close to {nearest_freeway.name}")
         elif min_freeway_dist < 300:
             score -= 20
-        elif min_freeway_dist < 500:
+        else:
             score -= 10
 
     # Check fire station proximity (siren noise)
-    min_fire_dist = float("inf")
-    nearest_fire = None
-    for station in fire_stations:
-        dist = haversine_meters(lat, lon, station["lat"], station["lon"])
-        if dist < min_fire_dist:
-            min_fire_dist = dist
-            nearest_fire = station
-
-    factors["nearest_fire_station"] = {
-        "name": nearest_fire["name"] if nearest_fire else "Unknown",
-        "distance_m": round(min_fire_dist, 1),
-    }
+    min_fire_dist, nearest_fire = _nearest_segment(lat, lon, city.fire_station_points)
 
     if min_fire_dist < 150:
         score -= 10
-        warnings.append(f"Near {nearest_fire['name']}")
-    elif min_fire_dist < 300:
+    elif min_fire_dist < FIRE_STATION_NOISE_RADIUS_M:
         score -= 5
 
-    # Determine confidence based on data quality
-    confidence = "high" if min_street_dist < 500 else "medium"
+    return TranquilityResult(
+        score=max(0, min(100, int(round(score)))),
+        # Determine confidence based on data quality
+        confidence="high" if min_street_dist < 500 else "medium",
+        nearest_street=nearest_street,
+        street_distance_m=min_street_dist,
+        nearest_freeway=nearest_freeway,
+        freeway_distance_m=min_freeway_dist,
+        nearest_fire_station=nearest_fire,
+        fire_station_distance_m=min_fire_dist,
+    )
+
+
+def format_tranquility(result: TranquilityResult) -> Dict:
+    """Render a TranquilityResult as the calculate_tranquility_score payload."""
+    if result.note:
+        return {
+            "score": result.score,
+            "factors": {},
+            "warnings": [result.note],
+            "confidence": result.confidence,
+        }
+
+    street = result.nearest_street
+    street_dist = result.street_distance_m
+    freeway = result.nearest_freeway
+    freeway_dist = result.freeway_distance_m
+    fire = result.nearest_fire_station
+    fire_dist = result.fire_station_distance_m
+
+    warnings = []
+    if street:
+        if street_dist < 30:
+            warnings.append(f"On {street.name} (high traffic)")
+        elif street_dist < 75:
+            warnings.append(f"Near {street.name}")
+    if freeway:
+        if freeway_dist < 100:
+            warnings.append(f"Adjacent to {freeway.name}")
+        elif freeway_dist < 200:
+            warnings.append(f"Very close to {freeway.name}")
+    if fire and fire_dist < 150:
+        warnings.append(f"Near {fire['name']}")
 
     return {
-        "score": max(0, min(100, int(round(score)))),
-        "factors": factors,
+        "score": result.score,
+        "factors": {
+            "nearest_busy_street": {
+                "name": street.name if street else "Unknown",
+                "distance_m": round(street_dist, 1),
+            },
+            "nearest_freeway": {
+                "name": freeway.name if freeway else "None nearby",
+                "distance_m": round(freeway_dist, 1),
+            },
+            "nearest_fire_station": {
+                "name": fire["name"] if fire else "Unknown",
+                "distance_m": round(fire_dist, 1),
+            },
+        },
         "warnings": warnings,
-        "confidence": confidence,
+        "confidence": result.confidence,
     }
 
 
+def calculate_tranquility_score(lat: Optional[float], lon: Optional[float]) -> Dict:
+    """
+    Calculate a Tranquility Score (0-100) based on proximity to noise sources.
+
+    Higher score = quieter location. Covers SF and NYC noise sources.
+    Returns None score for locations outside both coverage areas.
+
+    Returns:
+        {
+            "score": int (0-100) or None,
+            "factors": {
+                "nearest_busy_street": {"name": str, "distance_m": float},
+                "nearest_freeway": {"name": str, "distance_m": float},
+                "nearest_fire_station": {"name": str, "distance_m": float},
+            },
+            "warnings": List[str],
+            "confidence": str ("high" | "medium" | "low")
+        }
+
+    Points are snapped to a ~11m grid before scoring (see
+    TRANQUILITY_GRID_DECIMALS), so nearby listings share a cached result.
+
+    Callers that only need the score should use score_tranquility() and
+    skip the payload formatting.
+    """
+    return format_tranquility(score_tranquility(lat, lon))
+
+
+# =============================================================================
+# BATCH TRANQUILITY SCORING
+# =============================================================================
+
+
+def _in_envelope_mask(
+    lats: np.ndarray, lons: np.ndarray, envelope: Envelope
+) -> np.ndarray:
+    lat_min, lat_max, lon_min, lon_max = envelope
+    return (lats >= lat_min) & (lats <= lat_max) & (lons >= lon_min) & (lons <= lon_max)
+
+
+def _haversine_meters_np(
+    lat1: np.ndarray, lon1: np.ndarray, lat2: np.ndarray, lon2: np.ndarray
+) -> np.ndarray:
+    """Vectorized haversine_meters; inputs broadcast against each other."""
+    phi1 = np.radians(lat1)
+    phi2 = np.radians(lat2)
+    delta_phi = np.radians(lat2 - lat1)
+    delta_lambda = np.radians(lon2 - lon1)
+
+    a = (
+        np.sin(delta_phi / 2) ** 2
+        + np.cos(phi1) * np.cos(phi2) * np.sin(delta_lambda / 2) ** 2
+    )
+    c = 2 * np.arcsin(np.minimum(np.sqrt(a), 1.0))
+
+    return EARTH_RADIUS_M * c
+
+
+def _nearest_source_np(
+    lats: np.ndarray, lons: np.ndarray, table: SegmentTable
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Broadcast L points against every segment in a precomputed SegmentTable.
+
+    Returns (distance in meters, source index) per point, computed from an
+    (L, S) point-to-segment distance matrix. Ties resolve to the earliest
+    segment, i.e. the earliest source, matching _nearest_segment.
+    """
+    if not len(table.owner):
+        return np.full(lats.shape, np.inf), np.full(lats.shape, -1)
+
+    lat1 = table.lat1[None, :]
+    lon1 = table.lon1[None, :]
+    sy = table.dlat[None, :]
+    sx = table.dlon[None, :]
+    seg_len_sq = table.len_sq[None, :]
+
+    point_lat = lats[:, None]
+    point_lon = lons[:, None]
+    px = point_lon - lon1
+    py = point_lat - lat1
+
+    # Project onto each segment, clamped to [0, 1]; point-segments keep t=0
+    t = np.divide(
+        px * sx + py * sy,
+        seg_len_sq,
+        out=np.zeros(np.broadcast(px, sx).shape),
+        where=seg_len_sq != 0,
+    )
+    np.clip(t, 0, 1, out=t)
+
+    distances = _haversine_meters_np(point_lat, point_lon, lat1 + t * sy, lon1 + t * sx)
+    nearest_segment = np.argmin(distances, axis=1)
+    rows = np.arange(len(lats))
+    return distances[rows, nearest_segment], table.owner[nearest_segment]
+
+
+def _score_city_np(
+    lats: np.ndarray, lons: np.ndarray, city: CityNoise
+) -> Tuple[np.ndarray, ...]:
+    """
+    Vectorized _score_tranquility_cell for points inside one city.
+
+    Returns (score, street_dist, street_idx, freeway_dist, freeway_idx,
+    fire_dist, fire_idx); freeways and fire stations only cost points inside
+    their penalty radius, mirroring the scalar scan.
+    """
+    score = np.full(len(lats), 100.0)
+
+    street_dist, street_idx = _nearest_source_np(lats, lons, city.street_segments)
+    severity = np.asarray([s.severity for s in city.busy_streets] or [0.0])
+    score -= severity[street_idx] * np.select(
+        [street_dist < 30, street_dist < 75, street_dist < 150, street_dist < 300],
+        [35, 25, 15, 8],
+        0,
+    )
+
+    freeway_dist, freeway_idx = _nearest_source_np(lats, lons, city.freeway_segments)
+    score -= np.select(
+        [
+            freeway_dist < 100,
+            freeway_dist < 200,
+            freeway_dist < 300,
+            freeway_dist < FREEWAY_NOISE_RADIUS_M,
+        ],
+        [40, 30, 20, 10],
+        0,
+    )
+
+    fire_dist, fire_idx = _nearest_source_np(lats, lons, city.fire_station_points)
+    score -= np.select(
+        [fire_dist < 150, fire_dist < FIRE_STATION_NOISE_RADIUS_M], [10, 5], 0
+    )
+
+    return (
+        np.clip(np.round(score), 0, 100),
+        street_dist,
+        street_idx,
+        freeway_dist,
+        freeway_idx,
+        fire_dist,
+        fire_idx,
+    )
+
+
+def score_tranquility_many(
+    lats: Sequence[Optional[float]], lons: Sequence[Optional[float]]
+) -> List[TranquilityResult]:
+    """
+    Batch score_tranquility: one vectorized pass per city for many points.
+
+    Points are snapped to the same grid as score_tranquility and each
+    distinct cell is scored once, so results line up with the scalar
+    function and can be passed straight to format_tranquility.
+    """
+    results: List[Optional[TranquilityResult]] = [None] * len(lats)
+    cells: Dict[Tuple[float, float], List[int]] = {}
+    for i, (lat, lon) in enumerate(zip(lats, lons)):
+        if lat is None or lon is None:
+            results[i] = score_tranquility(lat, lon)
+            continue
+        cell = (
+            round(lat, TRANQUILITY_GRID_DECIMALS),
+            round(lon, TRANQUILITY_GRID_DECIMALS),
+        )
+        cells.setdefault(cell, []).append(i)
+
+    outside = TranquilityResult(
+        score=None, confidence="low", note="Outside coverage area"
+    )
+    cell_points = list(cells)
+    cell_lats = np.asarray([lat for lat, _ in cell_points], dtype=np.float64)
+    cell_lons = np.asarray([lon for _, lon in cell_points], dtype=np.float64)
+    cell_results = [outside] * len(cell_points)
+
+    in_sf = _in_envelope_mask(cell_lats, cell_lons, SF_BOUNDS)
+    in_nyc = _in_envelope_mask(cell_lats, cell_lons, NYC_BOUNDS) & ~in_sf
+    cities = ((in_sf, _sf_noise), (in_nyc, _nyc_noise))
+
+    for mask, load_city in cities:
+        if not mask.any():
+            continue
+        city = load_city()
+        (
+            score,
+            street_dist,
+            street_idx,
+            freeway_dist,
+            freeway_idx,
+            fire_dist,
+            fire_idx,
+        ) = (a.tolist() for a in _score_city_np(cell_lats[mask], cell_lons[mask], city))
+
+        for k, j in enumerate(np.flatnonzero(mask).tolist()):
+            has_street = street_idx[k] >= 0
+            has_freeway = freeway_idx[k] >= 0
+            has_fire = fire_idx[k] >= 0
+            cell_results[j] = TranquilityResult(
+                score=int(score[k]),
+                confidence="high" if street_dist[k] < 500 else "medium",
+                nearest_street=city.busy_streets[street_idx[k]] if has_street else None,
+                street_distance_m=street_dist[k],
+                nearest_freeway=city.freeways[freeway_idx[k]] if has_freeway else None,
+                freeway_distance_m=freeway_dist[k],
+                nearest_fire_station=(
+                    city.fire_stations[fire_idx[k]] if has_fire else None
+                ),
+                fire_station_distance_m=fire_dist[k],
+            )
+
+    for cell_result, indices in zip(cell_results, cells.values()):
+        for i in indices:
+            results[i] = cell_result
+    return results
+
+
 def get_tranquility_tier(score: int) -> str:
     """Get human-readable tier for tranquility score."""
     if score >= 80:
@@ -521,23 +1001,13 @@ def apply_location_modifiers(
 
 def is_on_busy_street(lat: float, lon: float, threshold_meters: float = 50) -> bool:
     """Check if a location is directly on a busy street."""
-    streets = SF_BUSY_STREETS
-    if _is_in_nyc(lat, lon):
-        streets = NYC_BUSY_STREETS
-    for street in streets:
-        dist = distance_to_polyline(lat, lon, street.coords)
-        if dist < threshold_meters:
-            return True
-    return False
+    city = _nyc_noise() if _is_in_nyc(lat, lon) else _sf_noise()
+    _, street = _nearest_segment(lat, lon, city.street_segments, threshold_meters)
+    return street is not None
 
 
 def is_near_freeway(lat: float, lon: float, threshold_meters: float = 200) -> bool:
     """Check if a location is near a freeway."""
-    freeways = SF_FREEWAYS
-    if _is_in_nyc(lat, lon):
-        freeways = NYC_FREEWAYS
-    for freeway in freeways:
-        dist = distance_to_polyline(lat, lon, freeway.coords)
-        if dist < threshold_meters:
-            return True
-    return False
+    city = _nyc_noise() if _is_in_nyc(lat, lon) else _sf_noise()
+    _, freeway = _nearest_segment(lat, lon, city.freeway_segments, threshold_meters)
+    return freeway is not None
@@ -1,22 +1,52 @@
 import asyncio
 import logging
-from datetime import datetime, timezone
+import time
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from operator import itemgetter
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from app.core.config import settings
 from app.providers.registry import get_active_providers
-from app.services.geospatial import calculate_tranquility_score
+from app.services.geospatial import format_tranquility, score_tranquility_many
 from app.services.listing_alerts import process_listing_alerts
-from app.services.neighborhoods import resolve_neighborhood
+from app.services.neighborhoods import (neighborhoods_from_coordinates_many,
+                                        normalize_neighborhood_name)
 from app.services.nlp import estimate_light_potential, extract_flags
-from app.services.persistence import upsert_listings
+from app.services.persistence import recently_updated_source_ids, upsert_listings
 from app.state import ingestion_state
 
 logger = logging.getLogger(__name__)
 
-SF_BBOX = (37.707, -122.515, 37.83, -122.355)  # lat_sw, lon_sw, lat_ne, lon_ne
-TILE_LAT_STEP = 0.02
-TILE_LON_STEP = 0.02
+UPSERT_CHUNK_SIZE = 500
+
+# Borough/city names detail endpoints return in place of a real neighborhood
+_GENERIC_DETAIL_NEIGHBORHOODS = frozenset(
+    {"brooklyn", "manhattan", "new york", "queens", "bronx", "staten island"}
+)
+
+
+class _RequestPacer:
+    """Space request starts at least ``interval`` seconds apart.
+
+    Unlike sleeping after each response, the wait only covers whatever part of
+    the interval the previous request did not already use, and a single pacer
+    can be shared by concurrent workers.
+    """
+
+    def __init__(self, interval: float):
+        self._interval = max(interval, 0.0)
+        self._next_start = 0.0
+
+    async def __aenter__(self) -> None:
+        now = asyncio.get_running_loop().time()
+        start = max(now, self._next_start)
+        self._next_start = start + self._interval
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    async def __aexit__(self, *exc_info: Any) -> bool:
+        return False
 
 
 def _apply_source_fields(listing: Dict[str, Any], source_key: str) -> Dict[str, Any]:
@@ -30,22 +60,6 @@ def _apply_source_fields(listing: Dict[str, Any], source_key: str) -> Dict[str,
     return listing
 
 
-def _generate_tiles(bbox: Tuple[float, float, float, float]):
-    lat_lo, lon_lo, lat_hi, lon_hi = bbox
-    lat = lat_lo
-    while lat < lat_hi:
-        lon = lon_lo
-        while lon < lon_hi:
-            yield (
-                lat,
-                lon,
-                min(lat + TILE_LAT_STEP, lat_hi),
-                min(lon + TILE_LON_STEP, lon_hi),
-            )
-            lon += TILE_LON_STEP
-        lat += TILE_LAT_STEP
-
-
 async def _fetch_summaries(
     provider,
     source_key: str,
@@ -60,32 +74,231 @@ async def _fetch_summaries(
         source_key,
         max_pages,
     )
+    pacer = _RequestPacer(settings.INGESTION_PAGE_DELAY_SECONDS)
     while page <= max_pages:
-        if hasattr(provider, "search_page"):
-            batch, more = await provider.search_page(page=page)
-        else:
-            batch = await provider.search(bbox=None, page=page)
-            more = False
+        async with pacer:
+            if hasattr(provider, "search_page"):
+                batch, more = await provider.search_page(page=page)
+            else:
+                batch = await provider.search(bbox=None, page=page)
+                more = False
         page_items = [_apply_source_fields(item, source_key) for item in batch]
         summaries.extend(page_items)
         if on_batch and page_items:
             on_batch(len(page_items))
         if not more:
             break
-        if settings.INGESTION_PAGE_DELAY_SECONDS > 0:
-            await asyncio.sleep(settings.INGESTION_PAGE_DELAY_SECONDS)
         page += 1
     return summaries
 
 
+# Duplicate listings from different providers repeat the same description, so
+# the description-derived lookups are memoized on their exact inputs.
+@lru_cache(maxsize=4096)
+def _cached_extract_flags(description: str) -> Dict[str, bool]:
+    return extract_flags(description)
+
+
+@lru_cache(maxsize=4096)
+def _cached_light_potential(
+    description: str,
+    is_north_facing_only: bool,
+    is_basement_unit: bool,
+    has_natural_light_keywords: bool,
+    photo_count: int,
+) -> Dict[str, Any]:
+    return estimate_light_potential(
+        description=description,
+        is_north_facing_only=is_north_facing_only,
+        is_basement_unit=is_basement_unit,
+        has_natural_light_keywords=has_natural_light_keywords,
+        photo_count=photo_count,
+    )
+
+
+def _summary_listing_id(listing: Dict[str, Any]) -> Any:
+    return listing.get("source_listing_id") or listing.get("listing_id")
+
+
+def _cpu_enrich(
+    summary_listing: Dict[str, Any], details: Dict[str, Any], source_key: str
+) -> Dict[str, Any]:
+    """
+    Merge fetched details into a summary and derive its text/location fields.
+
+    Pure CPU work with no I/O. Tranquility is left to _enrich_listings so it
+    can be scored for the whole batch at once. Summaries are enriched in
+    place; the fetched summary dicts are not used afterwards.
+    """
+    listing_id = _summary_listing_id(summary_listing)
+    if not listing_id:
+        logger.warning(
+            "Skipping enrichment for listing without listing_id (%s): %s",
+            source_key,
+            summary_listing.get("address"),
+        )
+        return _apply_source_fields(summary_listing, source_key)
+
+    listing_to_add = summary_listing
+    get = listing_to_add.get
+    # Preserve the search-tagged neighborhood over generic API response
+    saved_neighborhood = get("neighborhood")
+    if details:
+        # Merge details straight into the summary; no intermediate dicts
+        for key, value in details.items():
+            if value is not None:
+                listing_to_add[key] = value
+    neighborhood = get("neighborhood")
+
+    if details:
+        # Restore specific neighborhood if detail response gave a generic one
+        if saved_neighborhood and neighborhood != saved_neighborhood:
+            if (neighborhood or "").lower() in _GENERIC_DETAIL_NEIGHBORHOODS:
+                neighborhood = listing_to_add["neighborhood"] = saved_neighborhood
+
+        # Detail photos were merged above unless null; null clears them
+        listing_to_add["photos"] = (
+            details["photos"] if "photos" in details else get("photos")
+        ) or []
+
+    description = get("description") or ""
+    # Copy so a caller mutating one listing's flags can't touch the cache
+    flags = dict(_cached_extract_flags(description)) if description else {}
+    listing_to_add["flags"] = flags
+
+    # Coordinate fallback for unnamed neighborhoods runs batched in
+    # _enrich_listings
+    normalized = normalize_neighborhood_name(neighborhood)
+    if normalized:
+        listing_to_add["neighborhood"] = normalized
+
+    photos = get("photos")
+    try:
+        light_data = _cached_light_potential(
+            description,
+            flags.get("north_facing_only", False),
+            flags.get("basement_unit", False),
+            flags.get("natural_light", False),
+            len(photos) if photos else 0,
+        )
+        listing_to_add["light_potential_score"] = light_data["score"]
+        # Copy so listings sharing a cached result don't share one list
+        listing_to_add["light_potential_signals"] = list(light_data["signals"])
+    except Exception as exc:
+        logger.debug("Could not calculate light potential for %s: %s", listing_id, exc)
+
+    return _apply_source_fields(listing_to_add, source_key)
+
+
+def _enrich_listings(
+    summaries: List[Dict[str, Any]],
+    detail_results: Dict[int, Dict[str, Any]],
+    source_key: str,
+) -> List[Dict[str, Any]]:
+    """
+    Run _cpu_enrich over a batch, then back-fill neighborhoods from
+    coordinates and tranquility, each in one pass.
+
+    Blocking; _enrich_summaries runs it in a worker thread so the event loop
+    stays free for API requests while a large batch is processed.
+    """
+    enriched: List[Dict[str, Any]] = []
+    neighborhood_pending: List[Dict[str, Any]] = []
+    tranquility_pending: List[Dict[str, Any]] = []
+    for i, summary_listing in enumerate(summaries):
+        listing_id = _summary_listing_id(summary_listing)
+        logger.debug(
+            "Processing listing %d/%d (%s), ID: %s",
+            i + 1,
+            len(summaries),
+            source_key,
+            listing_id,
+        )
+
+        listing = _cpu_enrich(summary_listing, detail_results.get(i) or {}, source_key)
+        if listing_id and not normalize_neighborhood_name(listing.get("neighborhood")):
+            neighborhood_pending.append(listing)
+        if listing_id and listing.get("lat") and listing.get("lon"):
+            tranquility_pending.append(listing)
+        enriched.append(listing)
+
+    if neighborhood_pending:
+        names = neighborhoods_from_coordinates_many(
+            [listing.get("lat") for listing in neighborhood_pending],
+            [listing.get("lon") for listing in neighborhood_pending],
+        )
+        for listing, name in zip(neighborhood_pending, names):
+            if name:
+                listing["neighborhood"] = name
+
+    if tranquility_pending:
+        try:
+            results = score_tranquility_many(
+                [listing["lat"] for listing in tranquility_pending],
+                [listing["lon"] for listing in tranquility_pending],
+            )
+        except Exception as exc:
+            logger.debug(
+                "Could not calculate tranquility for %d %s listings: %s",
+                len(tranquility_pending),
+                source_key,
+                exc,
+            )
+        else:
+            for listing, result in zip(tranquility_pending, results):
+                tranquility = format_tranquility(result)
+                listing["tranquility_score"] = tranquility["score"]
+                listing["tranquility_factors"] = tranquility["factors"]
+
+    return enriched
+
+
+async def _demote_recently_updated(
+    candidates: List[Tuple[int, str]], source_key: str
+) -> List[Tuple[int, str]]:
+    """
+    Move candidates stored within INGESTION_DETAIL_REFRESH_HOURS to the end.
+
+    Only called when the detail cap cuts the list, so the capped calls go to
+    new and stale listings first. Order is otherwise kept, and a failed
+    lookup leaves the candidates as they were.
+    """
+    since = datetime.utcnow() - timedelta(hours=settings.INGESTION_DETAIL_REFRESH_HOURS)
+    try:
+        recent = await asyncio.to_thread(recently_updated_source_ids, source_key, since)
+    except Exception as exc:
+        logger.warning(
+            "Could not load recently updated %s listings: %s", source_key, exc
+        )
+        return candidates
+    if not recent:
+        return candidates
+    fresh = [c for c in candidates if c[1] not in recent]
+    logger.info(
+        "Deferring details for %d recently updated %s listings",
+        len(candidates) - len(fresh),
+        source_key,
+    )
+    return fresh + [c for c in candidates if c[1] in recent]
+
+
 async def _enrich_summaries(
     provider,
     source_key: str,
     supports_details: bool,
     summaries: List[Dict[str, Any]],
     on_detail_call: Optional[Callable[[], None]] = None,
+    detail_timeout: Optional[float] = None,
 ) -> Tuple[List[Dict[str, Any]], int]:
-    enriched: List[Dict[str, Any]] = []
+    """
+    Fetch details for up to the detail cap, then enrich every summary.
+
+    detail_timeout bounds only the network detail phase. When it expires the
+    details fetched so far are kept, and the CPU enrichment still runs to
+    completion outside the timeout, so a slow provider never discards its
+    summaries or leaves a worker thread mutating them after the caller
+    gave up.
+    """
     detail_calls_made = 0
     max_detail_calls = settings.MAX_DETAIL_CALLS
     provider_detail_cap = getattr(provider, "max_detail_calls", None)
@@ -121,14 +334,15 @@ async def _enrich_summaries(
     detail_candidates: List[Tuple[int, str]] = []
     if supports_details and max_detail_calls > 0:
         for i, summary_listing in enumerate(summaries):
-            listing_id = summary_listing.get("source_listing_id") or summary_listing.get(
-                "listing_id"
-            )
+            listing_id = _summary_listing_id(summary_listing)
             if not listing_id:
                 continue
             detail_candidates.append((i, str(listing_id)))
 
         if len(detail_candidates) > max_detail_calls:
+            detail_candidates = await _demote_recently_updated(
+                detail_candidates, source_key
+            )
             logger.info(
                 "Reached detail call limit (%d) for %s. Skipping remaining details.",
                 max_detail_calls,
@@ -136,13 +350,20 @@ async def _enrich_summaries(
             )
             detail_candidates = detail_candidates[:max_detail_calls]
 
-        semaphore = asyncio.Semaphore(detail_concurrency)
+        # A fixed pool of workers drains the candidate queue, so only
+        # detail_concurrency tasks are alive however many candidates there are.
+        queue: "asyncio.Queue[Tuple[int, str]]" = asyncio.Queue()
+        for candidate in detail_candidates:
+            queue.put_nowait(candidate)
 
-        async def fetch_detail(index: int, listing_id: str) -> Tuple[int, Dict[str, Any]]:
-            details: Dict[str, Any] = {}
+        # One pacer shared by all workers keeps the aggregate rate at
+        # detail_concurrency requests per detail_delay_seconds.
+        detail_pacer = _RequestPacer(detail_delay_seconds / detail_concurrency)
+
+        async def fetch_detail(listing_id: str) -> Dict[str, Any]:
             try:
-                async with semaphore:
-                    details = await asyncio.wait_for(
+                async with detail_pacer:
+                    return await asyncio.wait_for(
                         provider.get_details(listing_id),
                         timeout=detail_request_timeout,
                     )
@@ -161,112 +382,83 @@ async def _enrich_summaries(
                     exc,
                     exc_info=True,
                 )
-            finally:
-                if detail_delay_seconds > 0:
-                    await asyncio.sleep(detail_delay_seconds)
+            return {}
+
+        async def detail_worker() -> None:
+            nonlocal detail_calls_made
+            while not queue.empty():
+                index, listing_id = queue.get_nowait()
+                detail_results[index] = await fetch_detail(listing_id)
+                detail_calls_made += 1
                 if on_detail_call:
                     on_detail_call()
-            return index, details
 
-        tasks = [
-            asyncio.create_task(fetch_detail(index, listing_id))
-            for index, listing_id in detail_candidates
-        ]
+        # The task group cancels the remaining workers if one fails or the
+        # detail timeout expires
         try:
-            for task in asyncio.as_completed(tasks):
-                index, details = await task
-                detail_results[index] = details
-                detail_calls_made += 1
-        finally:
-            for task in tasks:
-                if not task.done():
-                    task.cancel()
-            if tasks:
-                await asyncio.gather(*tasks, return_exceptions=True)
-
-    for i, summary_listing in enumerate(summaries):
-        listing_id = summary_listing.get("source_listing_id") or summary_listing.get(
-            "listing_id"
-        )
-        logger.debug(
-            "Processing listing %d/%d (%s), ID: %s",
-            i + 1,
-            len(summaries),
-            source_key,
-            listing_id,
-        )
-
-        listing_to_add = summary_listing.copy()
-        if not listing_id:
-            logger.warning(
-                "Skipping enrichment for listing without listing_id (%s): %s",
-                source_key,
-                summary_listing.get("address"),
+            async with asyncio.timeout(detail_timeout):
+                async with asyncio.TaskGroup() as workers:
+                    for _ in range(min(detail_concurrency, len(detail_candidates))):
+                        workers.create_task(detail_worker())
+        except TimeoutError:
+            msg = (
+                f"Timeout during detail fetch ({source_key}) after "
+                f"{detail_timeout}s; kept {len(detail_results)} fetched details"
             )
-            enriched.append(_apply_source_fields(listing_to_add, source_key))
-            continue
-
-        details = detail_results.get(i) or {}
-        if details:
-            # Preserve the search-tagged neighborhood over generic API response
-            saved_neighborhood = listing_to_add.get("neighborhood")
-            listing_to_add.update({k: v for k, v in details.items() if v is not None})
-            # Restore specific neighborhood if detail response gave a generic one
-            if saved_neighborhood and listing_to_add.get("neighborhood") != saved_neighborhood:
-                detail_hood = (listing_to_add.get("neighborhood") or "").lower()
-                generic = {"brooklyn", "manhattan", "new york", "queens", "bronx", "staten island"}
-                if detail_hood in generic:
-                    listing_to_add["neighborhood"] = saved_neighborhood
-
-            if "photos" in details:
-                listing_to_add["photos"] = details.get("photos") or []
-            elif not listing_to_add.get("photos"):
-                listing_to_add["photos"] = []
-
-        description = listing_to_add.get("description") or ""
-        listing_to_add["flags"] = extract_flags(description) if description else {}
-
-        lat = listing_to_add.get("lat")
-        lon = listing_to_add.get("lon")
-        if lat and lon:
-            try:
-                tranquility = calculate_tranquility_score(lat, lon)
-                listing_to_add["tranquility_score"] = tranquility["score"]
-                listing_to_add["tranquility_factors"] = tranquility["factors"]
-            except Exception as exc:
-                logger.debug(
-                    "Could not calculate tranquility for %s: %s", listing_id, exc
-                )
+            logger.error(msg)
+            ingestion_state.last_run_error = msg
 
-        neighborhood = listing_to_add.get("neighborhood")
-        normalized = resolve_neighborhood(neighborhood, lat, lon)
-        if normalized:
-            listing_to_add["neighborhood"] = normalized
+    enriched = await asyncio.to_thread(
+        _enrich_listings, summaries, detail_results, source_key
+    )
+    return enriched, detail_calls_made
 
-        flags = listing_to_add.get("flags", {})
-        try:
-            light_data = estimate_light_potential(
-                description=description,
-                is_north_facing_only=flags.get("north_facing_only", False),
-                is_basement_unit=flags.get("basement_unit", False),
-                has_natural_light_keywords=flags.get("natural_light", False),
-                photo_count=len(listing_to_add.get("photos", [])),
-            )
-            listing_to_add["light_potential_score"] = light_data["score"]
-            listing_to_add["light_potential_signals"] = light_data["signals"]
-        except Exception as exc:
-            logger.debug(
-                "Could not calculate light potential for %s: %s", listing_id, exc
-            )
 
-        enriched.append(_apply_source_fields(listing_to_add, source_key))
+def _dedupe_and_rank_summaries(
+    summaries: List[Dict[str, Any]], price_max: Optional[int]
+) -> List[Dict[str, Any]]:
+    """
+    Drop repeated (source, id) summaries and order the rest for enrichment.
+
+    In-budget listings come first, then listings with more photos. The sort
+    key is computed in the same pass as the duplicate check, so each summary
+    is read once; summaries without any id are always kept.
+    """
+    seen_ids = set()
+    ranked: List[Tuple[Tuple[int, int], Dict[str, Any]]] = []
+    for s in summaries:
+        listing_id_value = s.get("listing_id")
+        source_listing_id = s.get("source_listing_id")
+        source_id = None
+        if source_listing_id not in (None, ""):
+            source_id = str(source_listing_id)
+        elif listing_id_value is not None:
+            source_id = str(listing_id_value)
+        else:
+            listing_url = s.get("url")
+            if isinstance(listing_url, str) and listing_url.strip():
+                source_id = listing_url.strip()
+        if source_id:
+            key = (s.get("source"), source_id)
+            if key in seen_ids:
+                continue
+            seen_ids.add(key)
 
-    return enriched, detail_calls_made
+        price = s.get("price")
+        in_budget = 0 if price_max and price and price <= price_max else 1
+        ranked.append(((in_budget, -len(s.get("photos", []))), s))
+
+    # Stable sort on the precomputed key keeps provider order within ties
+    ranked.sort(key=itemgetter(0))
+    return [s for _, s in ranked]
 
 
 async def run_ingestion_job():
     ingestion_state.is_running = True
     start_time = datetime.now(timezone.utc)
+    # Wall-clock times are for ingestion_state; the duration uses a monotonic
+    # clock so clock adjustments during a long run cannot skew it.
+    started_at = time.monotonic()
     ingestion_state.last_run_start_time = start_time
     ingestion_state.last_run_end_time = None
     ingestion_state.last_run_summary_count = 0
@@ -288,7 +480,7 @@ async def run_ingestion_job():
             ingestion_state.last_run_detail_calls = detail_calls_total
             ingestion_state.last_run_upsert_count = upsert_total
 
-        for spec in providers:
+        async def run_provider(spec) -> List[Dict[str, Any]]:
             provider = spec.factory()
             provider_summaries: List[Dict[str, Any]] = []
             provider_enriched: List[Dict[str, Any]] = []
@@ -328,26 +520,11 @@ async def run_ingestion_job():
                     )
 
                 if provider_summaries:
-                    # Deduplicate summaries before detail calls
-                    seen_ids = set()
-                    unique_summaries = []
-                    for s in provider_summaries:
-                        listing_id_value = s.get("listing_id")
-                        source_listing_id = s.get("source_listing_id")
-                        source_id = None
-                        if source_listing_id not in (None, ""):
-                            source_id = str(source_listing_id)
-                        elif listing_id_value is not None:
-                            source_id = str(listing_id_value)
-                        else:
-                            listing_url = s.get("url")
-                            if isinstance(listing_url, str) and listing_url.strip():
-                                source_id = listing_url.strip()
-                        key = (s.get("source"), source_id)
-                        if not source_id or key not in seen_ids:
-                            if source_id:
-                                seen_ids.add(key)
-                            unique_summaries.append(s)
+                    # Deduplicate summaries before detail calls, prioritizing
+                    # in-budget listings, then by photo count
+                    unique_summaries = _dedupe_and_rank_summaries(
+                        provider_summaries, settings.SEARCH_PRICE_MAX
+                    )
                     dupes_removed = len(provider_summaries) - len(unique_summaries)
                     if dupes_removed:
                         logger.info(
@@ -356,40 +533,23 @@ async def run_ingestion_job():
                             len(provider_summaries),
                             spec.key,
                             len(unique_summaries),
-                    )
-                    # Prioritize in-budget listings, then by photo count
-                    price_max = settings.SEARCH_PRICE_MAX
-                    unique_summaries.sort(
-                        key=lambda s: (
-                            0
-                            if price_max and s.get("price") and s["price"] <= price_max
-                            else 1,
-                            -(len(s.get("photos", []))),
                         )
-                    )
+
                     def on_detail_call() -> None:
                         nonlocal detail_calls_total
                         detail_calls_total += 1
                         publish_progress()
 
-                    try:
-                        provider_enriched, _ = await asyncio.wait_for(
-                            _enrich_summaries(
-                                provider,
-                                spec.key,
-                                spec.supports_details,
-                                unique_summaries,
-                                on_detail_call=on_detail_call,
-                            ),
-                            timeout=provider_timeout_seconds,
-                        )
-                    except asyncio.TimeoutError:
-                        msg = (
-                            f"Timeout during enrichment ({spec.key}) after "
-                            f"{provider_timeout_seconds}s"
-                        )
-                        logger.error(msg)
-                        ingestion_state.last_run_error = msg
+                    # Only the detail fetch is timed; enrichment of what was
+                    # fetched always completes and is kept
+                    provider_enriched, _ = await _enrich_summaries(
+                        provider,
+                        spec.key,
+                        spec.supports_details,
+                        unique_summaries,
+                        on_detail_call=on_detail_call,
+                        detail_timeout=provider_timeout_seconds,
+                    )
             finally:
                 try:
                     if hasattr(provider, "close"):
@@ -399,17 +559,35 @@ async def run_ingestion_job():
                         "Error closing %s provider: %s", spec.key, exc, exc_info=True
                     )
 
-            if provider_enriched:
-                upsert_listings(provider_enriched)
-                upsert_total += len(provider_enriched)
-                publish_progress()
-                all_enriched.extend(provider_enriched)
-                logger.info(
-                    "Ingestion job upserted %d listings for %s",
-                    len(provider_enriched),
-                    spec.key,
-                )
+            logger.info("Enriched %d listings for %s", len(provider_enriched), spec.key)
+            return provider_enriched
 
+        # Providers are independent sources, so their fetch/enrich pipelines
+        # overlap; one provider failing does not stop the others.
+        results = await asyncio.gather(
+            *(run_provider(spec) for spec in providers), return_exceptions=True
+        )
+        for spec, result in zip(providers, results):
+            if isinstance(result, BaseException):
+                logger.error(
+                    "Ingestion failed for %s: %s", spec.key, result, exc_info=result
+                )
+                ingestion_state.last_run_error = (
+                    f"Failed during ingestion ({spec.key}): {result}"
+                )
+            else:
+                all_enriched.extend(result)
+
+        # Persist the whole run in bounded chunks off the event loop, so a
+        # large run neither holds one long session nor blocks API requests
+        # (upsert_listings sleeps between retries on a locked SQLite file).
+        for start in range(0, len(all_enriched), UPSERT_CHUNK_SIZE):
+            chunk = all_enriched[start : start + UPSERT_CHUNK_SIZE]
+            await asyncio.to_thread(upsert_listings, chunk)
+            upsert_total += len(chunk)
+            publish_progress()
+        if all_enriched:
+            logger.info("Ingestion job upserted %d listings", upsert_total)
         publish_progress()
 
         if all_enriched:
@@ -432,7 +610,7 @@ async def run_ingestion_job():
         end_time = datetime.now(timezone.utc)
         ingestion_state.last_run_end_time = end_time
         ingestion_state.is_running = False
-        duration = (end_time - start_time).total_seconds()
+        duration = time.monotonic() - started_at
         logger.info(
             "Job finished at %s (Duration: %.2fs)", end_time.isoformat(), duration
         )
@@ -5,6 +5,7 @@ from __future__ import annotations
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
 
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
 
 from app.db.session import SessionLocal
@@ -15,12 +16,6 @@ from app.services.alerts import send_listing_alerts
 from app.services.criteria_config import load_buyer_criteria
 
 
-def _event_details(event: ListingEvent) -> Dict[str, Any]:
-    if event.details is None:
-        event.details = {}
-    return event.details
-
-
 def _build_alert_payload(listing: PropertyListing, reason: str) -> Dict[str, Any]:
     return {
         "listing_id": listing.id,
@@ -55,105 +50,135 @@ def process_listing_alerts(since: Optional[datetime] = None) -> Dict[str, int]:
     db: Session = SessionLocal()
     try:
         matcher = PropertyMatcher(criteria=None, db=db)
+        immediate_alerts: List[Dict[str, Any]] = []
+        digest_alerts: List[Dict[str, Any]] = []
+        # Score percent per listing id; None when a hard filter fails
+        scores: Dict[int, Optional[float]] = {}
+
+        def handle_new_listing(listing: PropertyListing, details: Dict[str, Any]):
+            if details.get("alerted_immediate"):
+                return
+            score = scores.get(listing.id)
+            if score is None:
+                return
+            # Try immediate alert first (high threshold)
+            if score >= immediate_threshold:
+                immediate_alerts.append(_build_alert_payload(listing, "New listing"))
+                details["alerted_immediate"] = True
+            elif not details.get("alerted_digest"):
+                # Didn't meet immediate threshold; digest only needs hard filters
+                digest_alerts.append(_build_alert_payload(listing, "New listing"))
+                details["alerted_digest"] = True
+
+        def handle_price_drop(listing: PropertyListing, details: Dict[str, Any]):
+            percent = (details or {}).get("percent")
+            if percent is None:
+                return
+            if scores.get(listing.id) is None:
+                return
+            if percent >= price_drop_threshold and not details.get("alerted_immediate"):
+                immediate_alerts.append(
+                    _build_alert_payload(listing, f"Price drop {percent:.0f}%")
+                )
+                details["alerted_immediate"] = True
+            elif percent >= digest_drop_threshold and not details.get("alerted_digest"):
+                digest_alerts.append(
+                    _build_alert_payload(listing, f"Price drop {percent:.0f}%")
+                )
+                details["alerted_digest"] = True
+
+        def handle_back_on_market(listing: PropertyListing, details: Dict[str, Any]):
+            if details.get("alerted_immediate"):
+                return
+            if scores.get(listing.id) is None:
+                return
+            immediate_alerts.append(_build_alert_payload(listing, "Back on market"))
+            details["alerted_immediate"] = True
+
+        handlers = {
+            "new_listing": handle_new_listing,
+            "price_drop": handle_price_drop,
+            "back_on_market": handle_back_on_market,
+        }
+
+        # Only the alerting event types leave the database; the
+        # (event_type, created_at) index serves this filter directly
+        recent_events = (
+            ListingEvent.event_type.in_(list(handlers)),
+            ListingEvent.created_at >= since_time,
+        )
         events = (
             db.query(ListingEvent)
-            .filter(ListingEvent.created_at >= since_time)
+            .filter(*recent_events)
             .order_by(ListingEvent.created_at.desc())
             .all()
         )
+        # Load every listing the events refer to in one query instead of a
+        # db.get per event
+        event_listing_ids = db.query(ListingEvent.listing_id).filter(*recent_events)
+        listings_by_id = {
+            listing.id: listing
+            for listing in db.query(PropertyListing).filter(
+                PropertyListing.id.in_(event_listing_ids.scalar_subquery())
+            )
+        }
 
-        immediate_alerts: List[Dict[str, Any]] = []
-        digest_alerts: List[Dict[str, Any]] = []
-
+        # DOM stale digest candidates: stale listings not yet alerted
+        stale_listings: List[PropertyListing] = []
+        if dom_threshold:
+            already_alerted = {
+                listing_id
+                for (listing_id,) in db.query(ListingEvent.listing_id)
+                .filter(ListingEvent.event_type == "dom_stale")
+                .distinct()
+            }
+            stale_listings = [
+                listing
+                for listing in db.query(PropertyListing).filter(
+                    PropertyListing.days_on_market >= dom_threshold
+                )
+                if listing.id not in already_alerted
+            ]
+
+        # Score every listing once up front; the handlers below only look up
+        # the result
+        to_score = dict(listings_by_id)
+        to_score.update((listing.id, listing) for listing in stale_listings)
+        scores.update(matcher.score_listings(to_score.values()))
+
+        # Handlers mark a copy of each event's details; changed copies are
+        # written back in one bulk UPDATE instead of through ORM dirty
+        # tracking, which misses in-place changes to a JSON column anyway
+        event_updates: List[Dict[str, Any]] = []
         for event in events:
-            listing = db.get(PropertyListing, event.listing_id)
+            listing = listings_by_id.get(event.listing_id)
             if not listing:
                 continue
-
-            details = _event_details(event)
-
-            if event.event_type == "new_listing":
-                if details.get("alerted_immediate"):
-                    continue
-                # Try immediate alert first (high threshold)
-                scored = matcher.score_listing(
-                    listing, min_score_percent=immediate_threshold
-                )
-                if scored:
-                    immediate_alerts.append(
-                        _build_alert_payload(listing, "New listing")
-                    )
-                    details["alerted_immediate"] = True
-                elif not details.get("alerted_digest"):
-                    # Didn't meet immediate threshold; try digest (just pass hard filters)
-                    scored_digest = matcher.score_listing(listing, min_score_percent=0)
-                    if scored_digest:
-                        digest_alerts.append(
-                            _build_alert_payload(listing, "New listing")
-                        )
-                        details["alerted_digest"] = True
-
-            elif event.event_type == "price_drop":
-                percent = (details or {}).get("percent")
-                if percent is None:
-                    continue
-                scored = matcher.score_listing(listing)
-                if not scored:
-                    continue
-                if percent >= price_drop_threshold and not details.get(
-                    "alerted_immediate"
-                ):
-                    immediate_alerts.append(
-                        _build_alert_payload(listing, f"Price drop {percent:.0f}%")
-                    )
-                    details["alerted_immediate"] = True
-                elif percent >= digest_drop_threshold and not details.get(
-                    "alerted_digest"
-                ):
-                    digest_alerts.append(
-                        _build_alert_payload(listing, f"Price drop {percent:.0f}%")
-                    )
-                    details["alerted_digest"] = True
-
-            elif event.event_type == "back_on_market":
-                if details.get("alerted_immediate"):
-                    continue
-                scored = matcher.score_listing(listing)
-                if not scored:
-                    continue
-                immediate_alerts.append(_build_alert_payload(listing, "Back on market"))
-                details["alerted_immediate"] = True
-
-        # DOM stale digest
-        if dom_threshold:
-            stale_listings = (
-                db.query(PropertyListing)
-                .filter(PropertyListing.days_on_market >= dom_threshold)
-                .all()
-            )
+            details = dict(event.details or {})
+            handlers[event.event_type](listing, details)
+            if details != (event.details or {}):
+                event_updates.append({"id": event.id, "details": details})
+        if event_updates:
+            db.execute(update(ListingEvent), event_updates)
+
+        if stale_listings:
+            dom_event_rows: List[Dict[str, Any]] = []
             for listing in stale_listings:
-                existing = (
-                    db.query(ListingEvent)
-                    .filter(
-                        ListingEvent.listing_id == listing.id,
-                        ListingEvent.event_type == "dom_stale",
-                    )
-                    .first()
-                )
-                if existing:
-                    continue
-                scored = matcher.score_listing(listing)
-                if not scored:
+                if scores.get(listing.id) is None:
                     continue
-                dom_event = ListingEvent(
-                    listing_id=listing.id,
-                    event_type="dom_stale",
-                    details={"days_on_market": listing.days_on_market},
+                dom_event_rows.append(
+                    {
+                        "listing_id": listing.id,
+                        "event_type": "dom_stale",
+                        "details": {"days_on_market": listing.days_on_market},
+                    }
                 )
-                db.add(dom_event)
                 digest_alerts.append(
                     _build_alert_payload(listing, f"DOM {listing.days_on_market}")
                 )
+            if dom_event_rows:
+                # One bulk INSERT; these events are not read back in this run
+                db.execute(insert(ListingEvent), dom_event_rows)
 
         if immediate_alerts:
             db.commit()
@@ -1,3 +1,4 @@
+import operator
 from typing import List
 
 from sqlalchemy import and_, select
@@ -6,34 +7,39 @@ from sqlalchemy.orm import Session
 from app.models.criteria import Criteria
 from app.models.listing import PropertyListing
 
+# (criteria attribute, column, comparison) applied when the attribute is set
+_CRITERIA_PREDICATES = (
+    ("price_min", PropertyListing.price, operator.ge),
+    ("price_max", PropertyListing.price, operator.le),
+    ("beds_min", PropertyListing.beds, operator.ge),
+    ("baths_min", PropertyListing.baths, operator.ge),
+    ("sqft_min", PropertyListing.sqft, operator.ge),
+)
+
+# (criteria attribute, keyword column) required to be true when the attribute is
+_CRITERIA_FLAGS = (
+    ("require_natural_light", PropertyListing.has_natural_light_keywords),
+    ("require_high_ceilings", PropertyListing.has_high_ceiling_keywords),
+    ("require_outdoor_space", PropertyListing.has_outdoor_space_keywords),
+)
+
 
 def find_matches(criteria: Criteria, db: Session) -> List[PropertyListing]:
     """Find property listings matching the given criteria."""
     query = select(PropertyListing)
-    filters = []
-
-    if criteria.price_min is not None:
-        filters.append(PropertyListing.price >= criteria.price_min)
-    if criteria.price_max is not None:
-        filters.append(PropertyListing.price <= criteria.price_max)
-    if criteria.beds_min is not None:
-        filters.append(PropertyListing.beds >= criteria.beds_min)
-    if criteria.baths_min is not None:
-        filters.append(PropertyListing.baths >= criteria.baths_min)
-    if criteria.sqft_min is not None:
-        filters.append(PropertyListing.sqft >= criteria.sqft_min)
-
-    if criteria.require_natural_light:
-        filters.append(PropertyListing.has_natural_light_keywords.is_(True))
-    if criteria.require_high_ceilings:
-        filters.append(PropertyListing.has_high_ceiling_keywords.is_(True))
-    if criteria.require_outdoor_space:
-        filters.append(PropertyListing.has_outdoor_space_keywords.is_(True))
+    filters = [
+        compare(column, value)
+        for attr, column, compare in _CRITERIA_PREDICATES
+        if (value := getattr(criteria, attr)) is not None
+    ]
+    filters += [
+        column.is_(True) for attr, column in _CRITERIA_FLAGS if getattr(criteria, attr)
+    ]
 
     if filters:
         query = query.where(and_(*filters))
 
     query = query.order_by(PropertyListing.price.asc().nulls_last())
 
-    results = db.scalars(query).all()
-    return list(results)
+    # .all() already returns a new list; no second copy
+    return db.scalars(query).all()
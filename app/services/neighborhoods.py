@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Optional, Sequence
+
+import numpy as np
 
 
 @dataclass(frozen=True)
@@ -69,6 +72,13 @@ NEIGHBORHOOD_BOXES: List[NeighborhoodBox] = [
 ]
 
 
+# Box edges as (K,) arrays for neighborhoods_from_coordinates_many
+_BOX_LAT_MIN = np.array([box.lat_min for box in NEIGHBORHOOD_BOXES])
+_BOX_LAT_MAX = np.array([box.lat_max for box in NEIGHBORHOOD_BOXES])
+_BOX_LON_MIN = np.array([box.lon_min for box in NEIGHBORHOOD_BOXES])
+_BOX_LON_MAX = np.array([box.lon_max for box in NEIGHBORHOOD_BOXES])
+
+
 _GENERIC_NEIGHBORHOODS = {
     "san francisco",
     "sf",
@@ -85,19 +95,48 @@ _GENERIC_NEIGHBORHOODS = {
 }
 
 
-def normalize_neighborhood_name(raw: Optional[str]) -> Optional[str]:
-    if not raw:
-        return None
-    cleaned = raw.strip().lower()
-    if not cleaned or cleaned in _GENERIC_NEIGHBORHOODS:
-        return None
+# Aliases in box order; earlier boxes win when several aliases match
+_ALIAS_ITEMS = [
+    (alias, box.name) for box in NEIGHBORHOOD_BOXES for alias in box.aliases
+]
 
+
+def _match_neighborhood_box(cleaned: str) -> Optional[str]:
     for box in NEIGHBORHOOD_BOXES:
         if cleaned == box.name.lower():
             return box.name
         for alias in box.aliases:
             if alias in cleaned:
                 return box.name
+    return None
+
+
+# Canonical names and aliases resolve with one dict lookup; the values come
+# from the ordered scan so precedence between boxes is unchanged.
+_EXACT_MAP = {
+    key: _match_neighborhood_box(key)
+    for key in [box.name.lower() for box in NEIGHBORHOOD_BOXES]
+    + [alias for alias, _ in _ALIAS_ITEMS]
+}
+
+
+# Providers repeat a small set of neighborhood strings, so results are
+# memoized on the raw input
+@lru_cache(maxsize=2048)
+def normalize_neighborhood_name(raw: Optional[str]) -> Optional[str]:
+    if not raw:
+        return None
+    cleaned = raw.strip().lower()
+    if not cleaned or cleaned in _GENERIC_NEIGHBORHOODS:
+        return None
+
+    exact = _EXACT_MAP.get(cleaned)
+    if exact:
+        return exact
+    # Not a canonical name, so only the alias substring checks can match
+    for alias, name in _ALIAS_ITEMS:
+        if alias in cleaned:
+            return name
 
     return raw.strip()
 
@@ -126,6 +165,27 @@ def neighborhood_from_coordinates(
     return None
 
 
+def neighborhoods_from_coordinates_many(
+    lats: Sequence[Optional[float]], lons: Sequence[Optional[float]]
+) -> List[Optional[str]]:
+    """Batch neighborhood_from_coordinates; the first matching box wins."""
+    lat = np.array([np.nan if v is None else v for v in lats], dtype=np.float64)
+    lon = np.array([np.nan if v is None else v for v in lons], dtype=np.float64)
+    # (N, K) containment mask; NaN coordinates compare False everywhere
+    inside = (
+        (lat[:, None] >= _BOX_LAT_MIN)
+        & (lat[:, None] <= _BOX_LAT_MAX)
+        & (lon[:, None] >= _BOX_LON_MIN)
+        & (lon[:, None] <= _BOX_LON_MAX)
+    )
+    first = inside.argmax(axis=1)
+    matched = inside.any(axis=1)
+    return [
+        NEIGHBORHOOD_BOXES[k].name if hit else None
+        for k, hit in zip(first.tolist(), matched.tolist())
+    ]
+
+
 def resolve_neighborhood(
     raw: Optional[str],
     lat: Optional[float],
@@ -1,4 +1,5 @@
-from typing import List, Optional
+import re
+from typing import Iterable, List, Optional
 
 KEYWORDS = {
     # Essential Attributes
@@ -528,13 +529,8 @@ POSITIVE_SIGNALS = {
 }
 
 
-def extract_flags(text: str) -> dict[str, bool]:
-    """Extract feature flags from property description text."""
-    text_lower = text.lower()
-    flags: dict[str, bool] = {}
-
-    # Define valid flags that match PropertyListing model columns
-    valid_positive_flags = [
+_VALID_POSITIVE_FLAGS = frozenset(
+    {
         "natural_light",
         "high_ceilings",
         "outdoor_space",
@@ -552,41 +548,92 @@ def extract_flags(text: str) -> dict[str, bool]:
         "gym_fitness",
         "doorman_concierge",
         "building_quality",
-    ]
+    }
+)
 
-    valid_red_flags = [
+_VALID_RED_FLAGS = frozenset(
+    {
         "busy_street",
         "foundation_issues",
         "hoa_issues",
         "no_pets",
-    ]
+    }
+)
+
+_PRICE_REDUCED_TERMS = ("reduced", "price improvement", "below market")
+_BACK_ON_MARKET_TERMS = ("back on market", "fell through", "previous buyer")
+
+
+def _trie_alternation(terms: Iterable[str]) -> str:
+    """Build a regex alternation over terms, factored on shared prefixes.
+
+    At any position the pattern matches the longest term starting there.
+    """
+    trie: dict = {}
+    for term in terms:
+        node = trie
+        for char in term:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: dict) -> str:
+        branches = [
+            re.escape(char) + build(child) for char, child in node.items() if char
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+_FLAG_TERMS = frozenset(
+    [term for terms in KEYWORDS.values() for term in terms]
+    + [term for terms in RED_FLAGS.values() for term in terms]
+    + [term for terms in POSITIVE_SIGNALS.values() for term in terms]
+    + list(_PRICE_REDUCED_TERMS)
+    + list(_BACK_ON_MARKET_TERMS)
+)
+# Zero-width lookahead so every start position is tried, overlaps included
+_FLAG_TERM_RE = re.compile(f"(?=({_trie_alternation(_FLAG_TERMS)}))")
+# Terms that are prefixes of a longer match start at the same position too
+_FLAG_TERM_PREFIXES = {
+    term: frozenset(
+        term[:i] for i in range(1, len(term) + 1) if term[:i] in _FLAG_TERMS
+    )
+    for term in _FLAG_TERMS
+}
+
+
+def _find_flag_terms(text_lower: str) -> set[str]:
+    """Return every flag or signal term that occurs as a substring of text_lower."""
+    found: set[str] = set()
+    for match in _FLAG_TERM_RE.finditer(text_lower):
+        found.update(_FLAG_TERM_PREFIXES[match.group(1)])
+    return found
+
+
+def extract_flags(text: str) -> dict[str, bool]:
+    """Extract feature flags from property description text."""
+    found = _find_flag_terms(text.lower())
+    flags: dict[str, bool] = {}
 
     # Check for positive features
     for key, terms in KEYWORDS.items():
-        if key in valid_positive_flags:
-            flags[key] = any(t in text_lower for t in terms)
-        elif key in valid_red_flags:
-            flags[key] = any(t in text_lower for t in terms)
+        if key in _VALID_POSITIVE_FLAGS or key in _VALID_RED_FLAGS:
+            flags[key] = not found.isdisjoint(terms)
         elif key == "motivated_seller":
             # Map motivated seller indicators to price reduction/back on market flags
-            if any(t in text_lower for t in terms):
-                if any(
-                    t in text_lower
-                    for t in ["reduced", "price improvement", "below market"]
-                ):
+            if not found.isdisjoint(terms):
+                if not found.isdisjoint(_PRICE_REDUCED_TERMS):
                     flags["price_reduced"] = True
-                if any(
-                    t in text_lower
-                    for t in ["back on market", "fell through", "previous buyer"]
-                ):
+                if not found.isdisjoint(_BACK_ON_MARKET_TERMS):
                     flags["back_on_market"] = True
 
     # Check for additional red flags
-    for key, terms in RED_FLAGS.items():
-        if key == "north_facing_only":
-            flags["north_facing_only"] = any(t in text_lower for t in terms)
-        elif key == "basement_unit":
-            flags["basement_unit"] = any(t in text_lower for t in terms)
+    for key in ("north_facing_only", "basement_unit"):
+        flags[key] = not found.isdisjoint(RED_FLAGS[key])
 
     return flags
 
@@ -596,7 +643,7 @@ def calculate_text_quality_score(text: str, criteria: dict = None) -> float:
     if not text:
         return 0.0
 
-    text_lower = text.lower()
+    found = _find_flag_terms(text.lower())
     score = 0.0
 
     # Default weights if no criteria weights provided
@@ -620,17 +667,17 @@ def calculate_text_quality_score(text: str, criteria: dict = None) -> float:
 
     # Add points for positive features
     for key, terms in KEYWORDS.items():
-        if any(t in text_lower for t in terms):
+        if not found.isdisjoint(terms):
             score += weights.get(key, 1)
 
     # Add bonus for positive signals
     for key, terms in POSITIVE_SIGNALS.items():
-        if any(t in text_lower for t in terms):
+        if not found.isdisjoint(terms):
             score += 2
 
     # Subtract for red flags
     for key, terms in RED_FLAGS.items():
-        if any(t in text_lower for t in terms):
+        if not found.isdisjoint(terms):
             score -= 5
 
     # Normalize score to 0-100 range
@@ -835,37 +882,26 @@ def get_light_potential_tier(score: int) -> str:
 
 def _unique_hits(text_lower: str, keywords: List[str]) -> List[str]:
     hits = [kw for kw in keywords if kw in text_lower]
-    # Preserve order, remove duplicates
-    seen = set()
-    deduped: List[str] = []
-    for hit in hits:
-        if hit not in seen:
-            deduped.append(hit)
-            seen.add(hit)
-    return deduped
-
+    # Preserve order, remove duplicates; most groups hit at most once
+    return list(dict.fromkeys(hits)) if len(hits) > 1 else hits
 
-def analyze_text_signals(text: str, nlp_config: dict) -> dict:
-    """Analyze description text for buyer-specific positive/negative signals."""
-    text_lower = (text or "").lower()
-    positive = nlp_config.get("positive") or {}
-    negative = nlp_config.get("negative") or {}
 
-    positive_hits: dict[str, List[str]] = {}
-    for group, payload in positive.items():
-        keywords = payload.get("keywords") or []
+def _group_hits(text_lower: str, groups: dict) -> dict[str, List[str]]:
+    group_hits: dict[str, List[str]] = {}
+    for group, payload in groups.items():
+        keywords = payload.get("keywords")
         if keywords:
             hits = _unique_hits(text_lower, keywords)
             if hits:
-                positive_hits[group] = hits
+                group_hits[group] = hits
+    return group_hits
 
-    negative_hits: dict[str, List[str]] = {}
-    for group, payload in negative.items():
-        keywords = payload.get("keywords") or []
-        if keywords:
-            hits = _unique_hits(text_lower, keywords)
-            if hits:
-                negative_hits[group] = hits
+
+def analyze_text_signals(text: str, nlp_config: dict) -> dict:
+    """Analyze description text for buyer-specific positive/negative signals."""
+    text_lower = (text or "").lower()
+    positive_hits = _group_hits(text_lower, nlp_config.get("positive") or {})
+    negative_hits = _group_hits(text_lower, nlp_config.get("negative") or {})
 
     # Context rules
     has_light_positive = bool(positive_hits.get("light"))
@@ -880,12 +916,15 @@ def analyze_text_signals(text: str, nlp_config: dict) -> dict:
     }
 
 
+_GENERIC_WORD_LIMIT = 80
+
+
 def is_generic_description(text: str, positive_hits: Optional[dict] = None) -> bool:
     """Heuristic: short, low-signal descriptions are treated as generic."""
     if not text:
         return True
-    words = text.split()
-    if len(words) < 80:
+    # maxsplit stops splitting once the 80-word cutoff is reached
+    if len(text.split(None, _GENERIC_WORD_LIMIT - 1)) < _GENERIC_WORD_LIMIT:
         if not positive_hits:
             return True
         unique_groups = len([k for k, v in positive_hits.items() if v])
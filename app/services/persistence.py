@@ -4,8 +4,10 @@ import time
 import hashlib
 import json
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from operator import attrgetter
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
+from sqlalchemy import func, inspect, select, tuple_
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
 
@@ -17,6 +19,43 @@ from app.services.visual_scoring import compute_photos_hash
 
 logger = logging.getLogger(__name__)
 
+# Bound on IN-list sizes for the batch prefetch queries
+PREFETCH_CHUNK_SIZE = 500
+
+# Listing columns a provider payload may overwrite on a stored row
+_UPDATABLE_ATTRIBUTES = frozenset(
+    attr.key for attr in inspect(PropertyListing).column_attrs
+) - {"id", "created_at"}
+
+# NLP flag names and the model attributes they populate
+_FLAG_ATTRIBUTES = {
+    "natural_light": "has_natural_light_keywords",
+    "high_ceilings": "has_high_ceiling_keywords",
+    "outdoor_space": "has_outdoor_space_keywords",
+    "parking": "has_parking_keywords",
+    "view": "has_view_keywords",
+    "updated_systems": "has_updated_systems_keywords",
+    "home_office": "has_home_office_keywords",
+    "storage": "has_storage_keywords",
+    "open_floor_plan": "has_open_floor_plan_keywords",
+    "architectural_details": "has_architectural_details_keywords",
+    "luxury": "has_luxury_keywords",
+    "designer": "has_designer_keywords",
+    "tech_ready": "has_tech_ready_keywords",
+    "price_reduced": "is_price_reduced",
+    "back_on_market": "is_back_on_market",
+    "busy_street": "has_busy_street_keywords",
+    "foundation_issues": "has_foundation_issues_keywords",
+    "hoa_issues": "has_hoa_issues_keywords",
+    "north_facing_only": "is_north_facing_only",
+    "basement_unit": "is_basement_unit",
+    "pet_friendly": "is_pet_friendly",
+    "no_pets": "is_no_pets",
+    "gym_fitness": "has_gym_keywords",
+    "doorman_concierge": "has_doorman_keywords",
+    "building_quality": "has_building_quality_keywords",
+}
+
 
 def _normalize_price(value: Any) -> Optional[float]:
     if value is None:
@@ -70,13 +109,136 @@ def _snapshot_hash(snapshot: Dict[str, Any]) -> str:
     return hashlib.sha256(encoded).hexdigest()
 
 
-def _get_latest_snapshot(db: Session, listing_id: int) -> Optional[ListingSnapshot]:
-    return (
-        db.query(ListingSnapshot)
-        .filter(ListingSnapshot.listing_id == listing_id)
-        .order_by(ListingSnapshot.created_at.desc())
-        .first()
-    )
+def _chunked(values: Iterable[Any]) -> Iterable[List[Any]]:
+    values = list(values)
+    for start in range(0, len(values), PREFETCH_CHUNK_SIZE):
+        yield values[start : start + PREFETCH_CHUNK_SIZE]
+
+
+def _assign_listing_ids(data: Dict[str, Any]) -> None:
+    source = data.get("source")
+    source_listing_id = data.get("source_listing_id") or data.get("listing_id")
+    if source and source_listing_id:
+        data["source_listing_id"] = str(source_listing_id)
+        if source != "zillow":
+            data["listing_id"] = _build_listing_id(source, data["source_listing_id"])
+        elif not data.get("listing_id"):
+            data["listing_id"] = data["source_listing_id"]
+
+
+class _ExistingListings:
+    """Stored listings for one upsert batch, indexed by each lookup key.
+
+    Replaces three SELECTs per listing with a few IN queries per batch.
+    Lookups keep the per-row precedence: (source, source_listing_id), then
+    listing_id, then url, and the lowest id wins when rows share a url.
+    """
+
+    def __init__(self, db: Session, listings: List[Dict[str, Any]]):
+        pairs = {
+            (data["source"], data["source_listing_id"])
+            for data in listings
+            if data.get("source") and data.get("source_listing_id")
+        }
+        listing_ids = {
+            str(data["listing_id"]) for data in listings if data.get("listing_id")
+        }
+        urls = {data["url"] for data in listings if data.get("url")}
+
+        key_filters = [
+            (tuple_(PropertyListing.source, PropertyListing.source_listing_id), pairs),
+            (PropertyListing.listing_id, listing_ids),
+            (PropertyListing.url, urls),
+        ]
+        rows: Dict[int, PropertyListing] = {}
+        for column, values in key_filters:
+            for chunk in _chunked(values):
+                for row in db.query(PropertyListing).filter(column.in_(chunk)):
+                    rows[row.id] = row
+
+        # Candidates per key in id order; a row stays listed under keys it
+        # has since moved away from, so lookups re-check the live attributes
+        self._indexes: Dict[str, Dict[Any, List[PropertyListing]]] = {
+            "source_id": {},
+            "listing_id": {},
+            "url": {},
+        }
+        self.ids = sorted(rows)
+        for row_id in self.ids:
+            self.add(rows[row_id])
+
+    @staticmethod
+    def _keys(listing: PropertyListing) -> Dict[str, Any]:
+        # Ids written this batch may still be ints on the instance; the
+        # String columns store (and compare) them as text
+        source_listing_id = listing.source_listing_id
+        listing_id = listing.listing_id
+        return {
+            "source_id": (
+                listing.source,
+                None if source_listing_id is None else str(source_listing_id),
+            ),
+            "listing_id": None if listing_id is None else str(listing_id),
+            "url": listing.url,
+        }
+
+    def add(self, listing: PropertyListing) -> None:
+        """Index a listing under its current keys, e.g. after a write."""
+        for name, key in self._keys(listing).items():
+            if not key:
+                continue
+            candidates = self._indexes[name].setdefault(key, [])
+            if listing not in candidates:
+                candidates.append(listing)
+                candidates.sort(key=attrgetter("id"))
+
+    def _lookup(self, name: str, key: Any) -> Optional[PropertyListing]:
+        for candidate in self._indexes[name].get(key, ()):
+            if self._keys(candidate)[name] == key:
+                return candidate
+        return None
+
+    def find(self, data: Dict[str, Any]) -> Optional[PropertyListing]:
+        source = data.get("source")
+        found = None
+        if source and data.get("source_listing_id"):
+            found = self._lookup("source_id", (source, data["source_listing_id"]))
+        if found is None and data.get("listing_id"):
+            found = self._lookup("listing_id", str(data["listing_id"]))
+        if found is None and data.get("url"):
+            found = self._lookup("url", data["url"])
+        return found
+
+
+def _latest_snapshots(
+    db: Session, listing_ids: Iterable[int]
+) -> Dict[int, ListingSnapshot]:
+    latest: Dict[int, ListingSnapshot] = {}
+    for chunk in _chunked(listing_ids):
+        ranked = (
+            select(
+                ListingSnapshot.id,
+                func.row_number()
+                .over(
+                    partition_by=ListingSnapshot.listing_id,
+                    order_by=(
+                        ListingSnapshot.created_at.desc(),
+                        ListingSnapshot.id.desc(),
+                    ),
+                )
+                .label("recency"),
+            )
+            .where(ListingSnapshot.listing_id.in_(chunk))
+            .subquery()
+        )
+        snapshots = (
+            db.query(ListingSnapshot)
+            .join(ranked, ranked.c.id == ListingSnapshot.id)
+            .filter(ranked.c.recency == 1)
+        )
+        for snapshot in snapshots:
+            latest[snapshot.listing_id] = snapshot
+    return latest
 
 
 def _build_events(
@@ -175,6 +337,155 @@ def _build_events(
     return events
 
 
+def recently_updated_source_ids(source: str, since: datetime) -> Set[str]:
+    """Return source_listing_ids of `source` listings updated at or after `since`.
+
+    `since` is naive UTC, matching how `last_updated` is stored.
+    """
+    db: Session = SessionLocal()
+    try:
+        rows = db.query(PropertyListing.source_listing_id).filter(
+            PropertyListing.source == source,
+            PropertyListing.source_listing_id.isnot(None),
+            PropertyListing.last_updated >= since,
+        )
+        return {source_listing_id for (source_listing_id,) in rows}
+    finally:
+        db.close()
+
+
+def _is_sqlite_locked_error(exc: OperationalError) -> bool:
+    msg = str(exc).lower()
+    return ("database is locked" in msg) or ("database is busy" in msg)
+
+
+def _upsert_batch(db: Session, listings: List[Dict[str, Any]]) -> Tuple[int, int]:
+    """Write one batch inside db's open transaction; the caller commits.
+
+    Returns (upserted, failed) row counts. A SQLite lock error propagates so
+    the caller can retry the whole transaction.
+    """
+    upserted_count = 0
+    failed_count = 0
+    existing_listings = _ExistingListings(db, listings)
+    latest_snapshots = _latest_snapshots(db, existing_listings.ids)
+    # One clock read per batch; every row in it was seen in the same run
+    seen_at = datetime.now(timezone.utc)
+    updated_at = datetime.utcnow()
+
+    for data in listings:
+
+        # If a provider explicitly sets a model boolean (e.g. `has_doorman_keywords=True`),
+        # we should not allow NLP-derived `flags` to overwrite it with a `False` default.
+        explicit_attrs = {k for k, v in data.items() if k != "flags" and v is not None}
+
+        # A savepoint per listing lets a bad row (duplicate key,
+        # constraint error) roll back alone inside the batch transaction
+        savepoint = db.begin_nested()
+        try:
+            source = data.get("source")
+            existing = existing_listings.find(data)
+            old_snapshot = latest_snapshots.get(existing.id) if existing else None
+            new_snapshot: Optional[ListingSnapshot] = None
+            flags = data.get("flags") or {}
+
+            if existing:
+                for k, v in data.items():
+                    if k == "flags":
+                        for fk, fv in flags.items():
+                            attr = _FLAG_ATTRIBUTES.get(fk)
+                            if attr and attr not in explicit_attrs:
+                                setattr(existing, attr, fv)
+                    elif k == "photos":
+                        if v:
+                            setattr(existing, k, v)
+                    elif k in _UPDATABLE_ATTRIBUTES:
+                        setattr(existing, k, v)
+                if source and not existing.source:
+                    existing.source = source
+                if source and data.get("source_listing_id"):
+                    existing.source_listing_id = data.get("source_listing_id")
+                if source:
+                    sources_seen = existing.sources_seen or []
+                    if source not in sources_seen:
+                        sources_seen.append(source)
+                    existing.sources_seen = sources_seen
+                existing.last_seen_at = seen_at
+                existing.last_updated = updated_at
+                listing = existing
+            else:
+                # Prepare attributes with valid flags
+                record_attrs = {k: v for k, v in data.items() if k != "flags"}
+                for fk, fv in flags.items():
+                    attr = _FLAG_ATTRIBUTES.get(fk)
+                    if attr and record_attrs.get(attr) is None:
+                        record_attrs[attr] = fv
+
+                if source:
+                    record_attrs["source"] = source
+                    record_attrs["sources_seen"] = [source]
+                if data.get("source_listing_id"):
+                    record_attrs["source_listing_id"] = data["source_listing_id"]
+                record_attrs["last_seen_at"] = seen_at
+
+                new_record = PropertyListing(**record_attrs)
+                db.add(new_record)
+                db.flush()
+                listing = new_record
+
+            if listing.neighborhood is None:
+                normalized = resolve_neighborhood(None, listing.lat, listing.lon)
+                if normalized:
+                    listing.neighborhood = normalized
+
+            snapshot_data = _build_snapshot(listing)
+            snapshot_hash = _snapshot_hash(snapshot_data)
+            if not old_snapshot or old_snapshot.snapshot_hash != snapshot_hash:
+                new_snapshot = ListingSnapshot(
+                    listing_id=listing.id,
+                    snapshot_hash=snapshot_hash,
+                    snapshot_data=snapshot_data,
+                )
+                db.add(new_snapshot)
+                events = _build_events(
+                    listing_id=listing.id,
+                    old_snapshot=(old_snapshot.snapshot_data if old_snapshot else None),
+                    new_snapshot=snapshot_data,
+                )
+                for event in events:
+                    db.add(event)
+
+            savepoint.commit()
+            # Later duplicates in the batch must see this write
+            existing_listings.add(listing)
+            if new_snapshot is not None:
+                latest_snapshots[listing.id] = new_snapshot
+            upserted_count += 1
+
+        except OperationalError as exc:
+            savepoint.rollback()
+            if _is_sqlite_locked_error(exc):
+                # The lock is held against the whole batch transaction, so
+                # upsert_listings retries the batch rather than this row
+                raise
+            logger.warning(
+                "Failed to upsert listing %s: %s",
+                data.get("listing_id", "unknown"),
+                exc,
+            )
+            failed_count += 1
+        except Exception as exc:
+            savepoint.rollback()
+            logger.warning(
+                "Failed to upsert listing %s: %s",
+                data.get("listing_id", "unknown"),
+                exc,
+            )
+            failed_count += 1
+
+    return upserted_count, failed_count
+
+
 def upsert_listings(listings: List[Dict[str, Any]]):
     """Insert or update listing records in the database.
 
@@ -182,204 +493,49 @@ def upsert_listings(listings: List[Dict[str, Any]]):
     - Uses `source` + `source_listing_id` when present; falls back to `listing_id` or URL.
     - Applies extracted `flags` to boolean keyword columns.
     - Avoids mutating `photos` when merging (kept as JSON list on model).
+    - Writes the batch in one transaction with a savepoint per listing, so a
+      bad row rolls back alone and the batch commits once. SQLite lock errors
+      retry the whole batch.
     """
-    upserted_count = 0
-    db: Session = SessionLocal()
-
-    def _is_sqlite_locked_error(exc: OperationalError) -> bool:
-        msg = str(exc).lower()
-        return ("database is locked" in msg) or ("database is busy" in msg)
+    listings = [data for data in listings if data.get("address")]
+    # Resolve ids up front so the batch's stored rows and their latest
+    # snapshots load in a few queries instead of several per listing
+    for data in listings:
+        _assign_listing_ids(data)
 
-    try:
-        for data in listings:
-            if not data.get("address"):
+    upserted_count = 0
+    failed_count = 0
+    for attempt in range(1, 6):
+        db: Session = SessionLocal()
+        try:
+            upserted_count, failed_count = _upsert_batch(db, listings)
+            # One commit for the whole batch instead of one per listing
+            db.commit()
+            break
+        except Exception as exc:
+            db.rollback()
+            upserted_count = 0
+            if (
+                isinstance(exc, OperationalError)
+                and _is_sqlite_locked_error(exc)
+                and attempt < 5
+            ):
+                wait = min(0.5 * (2 ** (attempt - 1)), 5.0) + random.uniform(0, 0.25)
+                logger.warning(
+                    "SQLite locked while upserting %d listings (attempt %d/5). Retrying in %.2fs",
+                    len(listings),
+                    attempt,
+                    wait,
+                )
+                time.sleep(wait)
                 continue
-
-            # If a provider explicitly sets a model boolean (e.g. `has_doorman_keywords=True`),
-            # we should not allow NLP-derived `flags` to overwrite it with a `False` default.
-            explicit_attrs = {
-                k for k, v in data.items() if k != "flags" and v is not None
-            }
-
-            for attempt in range(1, 6):
-                try:
-                    source = data.get("source")
-                    source_listing_id = data.get("source_listing_id") or data.get(
-                        "listing_id"
-                    )
-                    if source and source_listing_id:
-                        data["source_listing_id"] = str(source_listing_id)
-                        if source != "zillow":
-                            data["listing_id"] = _build_listing_id(
-                                source, data["source_listing_id"]
-                            )
-                        elif not data.get("listing_id"):
-                            data["listing_id"] = data["source_listing_id"]
-
-                    existing: Optional[PropertyListing] = None
-                    if source and data.get("source_listing_id"):
-                        existing = (
-                            db.query(PropertyListing)
-                            .filter_by(
-                                source=source,
-                                source_listing_id=data["source_listing_id"],
-                            )
-                            .first()
-                        )
-
-                    if not existing and data.get("listing_id"):
-                        existing = (
-                            db.query(PropertyListing)
-                            .filter_by(listing_id=data["listing_id"])
-                            .first()
-                        )
-
-                    if not existing and data.get("url"):
-                        existing = (
-                            db.query(PropertyListing).filter_by(url=data["url"]).first()
-                        )
-
-                    old_snapshot = (
-                        _get_latest_snapshot(db, existing.id) if existing else None
-                    )
-                    flags = data.get("flags") or {}
-
-                    # Map of valid flag names to their corresponding model attributes
-                    valid_flags = {
-                        "natural_light": "has_natural_light_keywords",
-                        "high_ceilings": "has_high_ceiling_keywords",
-                        "outdoor_space": "has_outdoor_space_keywords",
-                        "parking": "has_parking_keywords",
-                        "view": "has_view_keywords",
-                        "updated_systems": "has_updated_systems_keywords",
-                        "home_office": "has_home_office_keywords",
-                        "storage": "has_storage_keywords",
-                        "open_floor_plan": "has_open_floor_plan_keywords",
-                        "architectural_details": "has_architectural_details_keywords",
-                        "luxury": "has_luxury_keywords",
-                        "designer": "has_designer_keywords",
-                        "tech_ready": "has_tech_ready_keywords",
-                        "price_reduced": "is_price_reduced",
-                        "back_on_market": "is_back_on_market",
-                        "busy_street": "has_busy_street_keywords",
-                        "foundation_issues": "has_foundation_issues_keywords",
-                        "hoa_issues": "has_hoa_issues_keywords",
-                        "north_facing_only": "is_north_facing_only",
-                        "basement_unit": "is_basement_unit",
-                        "pet_friendly": "is_pet_friendly",
-                        "no_pets": "is_no_pets",
-                        "gym_fitness": "has_gym_keywords",
-                        "doorman_concierge": "has_doorman_keywords",
-                        "building_quality": "has_building_quality_keywords",
-                    }
-
-                    seen_at = datetime.now(timezone.utc)
-
-                    if existing:
-                        for k, v in data.items():
-                            if k == "flags":
-                                for fk, fv in flags.items():
-                                    if fk in valid_flags:
-                                        attr = valid_flags[fk]
-                                        if attr in explicit_attrs:
-                                            continue
-                                        setattr(existing, attr, fv)
-                            elif k == "photos":
-                                if v:
-                                    setattr(existing, k, v)
-                            else:
-                                setattr(existing, k, v)
-                        if source and not existing.source:
-                            existing.source = source
-                        if source and data.get("source_listing_id"):
-                            existing.source_listing_id = data.get("source_listing_id")
-                        if source:
-                            sources_seen = existing.sources_seen or []
-                            if source not in sources_seen:
-                                sources_seen.append(source)
-                            existing.sources_seen = sources_seen
-                        existing.last_seen_at = seen_at
-                        existing.last_updated = datetime.utcnow()
-                        listing = existing
-                    else:
-                        # Prepare attributes with valid flags
-                        record_attrs = {k: v for k, v in data.items() if k != "flags"}
-                        for fk, fv in flags.items():
-                            if fk in valid_flags:
-                                attr = valid_flags[fk]
-                                if record_attrs.get(attr) is not None:
-                                    continue
-                                record_attrs[attr] = fv
-
-                        if source:
-                            record_attrs["source"] = source
-                            record_attrs["sources_seen"] = [source]
-                        if data.get("source_listing_id"):
-                            record_attrs["source_listing_id"] = data["source_listing_id"]
-                        record_attrs["last_seen_at"] = seen_at
-
-                        new_record = PropertyListing(**record_attrs)
-                        db.add(new_record)
-                        db.flush()
-                        listing = new_record
-
-                    if listing.neighborhood is None:
-                        normalized = resolve_neighborhood(None, listing.lat, listing.lon)
-                        if normalized:
-                            listing.neighborhood = normalized
-
-                    snapshot_data = _build_snapshot(listing)
-                    snapshot_hash = _snapshot_hash(snapshot_data)
-                    if not old_snapshot or old_snapshot.snapshot_hash != snapshot_hash:
-                        db.add(
-                            ListingSnapshot(
-                                listing_id=listing.id,
-                                snapshot_hash=snapshot_hash,
-                                snapshot_data=snapshot_data,
-                            )
-                        )
-                        events = _build_events(
-                            listing_id=listing.id,
-                            old_snapshot=(
-                                old_snapshot.snapshot_data if old_snapshot else None
-                            ),
-                            new_snapshot=snapshot_data,
-                        )
-                        for event in events:
-                            db.add(event)
-
-                    # Commit after each listing to handle duplicates gracefully
-                    db.commit()
-                    upserted_count += 1
-                    break
-
-                except OperationalError as exc:
-                    db.rollback()
-                    db.expunge_all()
-                    if _is_sqlite_locked_error(exc) and attempt < 5:
-                        wait = min(0.5 * (2 ** (attempt - 1)), 5.0) + random.uniform(
-                            0, 0.25
-                        )
-                        logger.warning(
-                            "SQLite locked while upserting %s (attempt %d/5). Retrying in %.2fs",
-                            data.get("listing_id", "unknown"),
-                            attempt,
-                            wait,
-                        )
-                        time.sleep(wait)
-                        continue
-                    print(
-                        f"Failed to upsert listing {data.get('listing_id', 'unknown')}: {exc}"
-                    )
-                    break
-                except Exception as exc:
-                    db.rollback()
-                    db.expunge_all()
-                    print(
-                        f"Failed to upsert listing {data.get('listing_id', 'unknown')}: {exc}"
-                    )
-                    break
-
-    finally:
-        db.close()
-        print(f"Successfully upserted {upserted_count} listings")
+            logger.error(
+                "Failed to upsert a batch of %d listings: %s",
+                len(listings),
+                exc,
+                exc_info=True,
+            )
+            break
+        finally:
+            db.close()
+    logger.info("Upserted %d listings (%d failed)", upserted_count, failed_count)
@@ -0,0 +1,32 @@
+"""Add composite (event_type, created_at) index to listing_events.
+
+Alert processing reads recent events of a few types; the composite index
+serves that range scan directly instead of intersecting two single-column
+indexes.
+
+Revision ID: listing_events_002
+Revises: nyc_rental_cols_001
+Create Date: 2026-10-16
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "listing_events_002"
+down_revision = "nyc_rental_cols_001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    event_indexes = {idx["name"] for idx in inspector.get_indexes("listing_events")}
+    if "ix_listing_events_type_created" not in event_indexes:
+        op.create_index(
+            "ix_listing_events_type_created",
+            "listing_events",
+            ["event_type", "created_at"],
+        )
+
+
+def downgrade():
+    op.drop_index("ix_listing_events_type_created", table_name="listing_events")
@@ -12,6 +12,7 @@ os.environ.setdefault("ZENROWS_API_KEY", "")
 
 from app.main import app
 from app.models import Base
+from app.db.session import enable_sqlite_transactions
 from app.dependencies import get_db
 from app.models.user import User
 
@@ -23,6 +24,8 @@ SQLALCHEMY_TEST_DATABASE_URL = os.environ.get(
 engine = create_engine(
     SQLALCHEMY_TEST_DATABASE_URL, connect_args={"check_same_thread": False}
 )
+if SQLALCHEMY_TEST_DATABASE_URL.startswith("sqlite"):
+    enable_sqlite_transactions(engine)
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -0,0 +1,110 @@
+import pytest
+
+from app.services.geospatial import (SF_BUSY_STREETS,
+                                     calculate_tranquility_score,
+                                     distance_to_polyline, format_tranquility,
+                                     is_near_freeway, is_on_busy_street,
+                                     score_tranquility, score_tranquility_many)
+
+SAMPLE_POINTS = [
+    (37.7849, -122.4399),  # on Divisadero
+    (37.7749, -122.4094),  # on US-101
+    (37.7629, -122.4154),  # at Station 7 (Mission)
+    (37.7600, -122.5000),  # Outer Sunset, far from freeways
+    (40.7200, -73.9900),  # Lower East Side
+    (40.6990, -73.9870),  # DUMBO, next to the BQE
+    (40.6700, -73.9300),  # Crown Heights, edge of NYC coverage
+    (34.0522, -118.2437),  # Los Angeles, outside coverage
+]
+
+
+def test_batch_payloads_match_scalar_payloads():
+    lats = [lat for lat, _ in SAMPLE_POINTS]
+    lons = [lon for _, lon in SAMPLE_POINTS]
+
+    batch = score_tranquility_many(lats, lons)
+
+    for result, lat, lon in zip(batch, lats, lons):
+        payload = format_tranquility(result)
+        scalar = calculate_tranquility_score(lat, lon)
+        assert payload["score"] == scalar["score"]
+        assert payload["warnings"] == scalar["warnings"]
+        assert payload["factors"].keys() == scalar["factors"].keys()
+        for key, expected in scalar["factors"].items():
+            assert payload["factors"][key]["name"] == expected["name"]
+            assert payload["factors"][key]["distance_m"] == pytest.approx(
+                expected["distance_m"], abs=0.05
+            )
+
+
+def test_tranquility_penalizes_freeway_adjacency():
+    on_freeway = calculate_tranquility_score(37.7749, -122.4094)
+    outer_sunset = calculate_tranquility_score(37.7600, -122.5000)
+
+    assert on_freeway["score"] < outer_sunset["score"]
+    assert any("US-101" in warning for warning in on_freeway["warnings"])
+    # Out-of-range sources are still reported, they just don't cost points
+    far_freeway = outer_sunset["factors"]["nearest_freeway"]
+    assert far_freeway["name"] != "None nearby"
+    assert far_freeway["distance_m"] > 500
+    far_station = outer_sunset["factors"]["nearest_fire_station"]
+    assert far_station["name"] != "Unknown"
+    assert far_station["distance_m"] > 300
+
+
+def test_score_tranquility_returns_raw_result_without_payload():
+    result = score_tranquility(37.7849, -122.4399)
+
+    assert result.score == calculate_tranquility_score(37.7849, -122.4399)["score"]
+    assert result.nearest_street.name == "Divisadero Street"
+    assert result.note is None
+
+    outside = score_tranquility(34.0522, -118.2437)
+    assert outside.score is None
+    assert outside.note == "Outside coverage area"
+
+
+def test_score_tranquility_pruned_scan_matches_full_polyline_scan():
+    for step in range(60):
+        lat = round(37.71 + step * 0.002, 4)
+        lon = round(-122.51 + step * 0.0025, 4)
+
+        expected = min(
+            SF_BUSY_STREETS,
+            key=lambda street: distance_to_polyline(lat, lon, street.coords),
+        )
+        result = score_tranquility(lat, lon)
+
+        assert result.nearest_street is expected
+        assert result.street_distance_m == pytest.approx(
+            distance_to_polyline(lat, lon, expected.coords)
+        )
+
+
+def test_threshold_checks_only_match_sources_within_range():
+    assert is_on_busy_street(37.7849, -122.4399)
+    assert not is_on_busy_street(37.7600, -122.5000)
+    assert is_near_freeway(40.6990, -73.9870)
+    assert not is_near_freeway(37.7600, -122.5000, threshold_meters=1000)
+
+
+def test_score_tranquility_reuses_result_within_grid_cell():
+    result = score_tranquility(37.7849, -122.4399)
+
+    assert score_tranquility(37.78491, -122.43989) is result
+    assert score_tranquility(37.7851, -122.4399) is not result
+
+
+def test_score_tranquility_many_matches_scalar_results():
+    lats = [lat for lat, _ in SAMPLE_POINTS] + [None]
+    lons = [lon for _, lon in SAMPLE_POINTS] + [None]
+
+    results = score_tranquility_many(lats, lons)
+
+    for result, lat, lon in zip(results, lats, lons):
+        expected = score_tranquility(lat, lon)
+        assert result.score == expected.score
+        assert result.nearest_street is expected.nearest_street
+        assert result.nearest_freeway is expected.nearest_freeway
+        assert result.nearest_fire_station is expected.nearest_fire_station
+        assert result.street_distance_m == pytest.approx(expected.street_distance_m)
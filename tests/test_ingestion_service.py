@@ -1,7 +1,14 @@
 import asyncio
+import time
 
 from app.core.config import settings
-from app.services.ingestion import _enrich_summaries, _fetch_summaries
+from app.providers.registry import ProviderSpec
+from app.services import ingestion
+from app.services.geospatial import calculate_tranquility_score
+from app.services.ingestion import (_dedupe_and_rank_summaries,
+                                    _enrich_summaries, _fetch_summaries,
+                                    _RequestPacer)
+from app.state import ingestion_state
 
 
 class _PagedProvider:
@@ -23,6 +30,19 @@ class _DetailProviderWithCap(_DetailProvider):
     max_detail_calls = 1
 
 
+class _InFlightTrackingProvider:
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def get_details(self, listing_id):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0)
+        self.in_flight -= 1
+        return {"description": f"listing {listing_id}"}
+
+
 def test_fetch_summaries_reports_incremental_batches(monkeypatch):
     monkeypatch.setattr(settings, "MAX_PAGES", 5)
     monkeypatch.setattr(settings, "INGESTION_PAGE_DELAY_SECONDS", 0.0)
@@ -40,6 +60,40 @@ def test_fetch_summaries_reports_incremental_batches(monkeypatch):
     assert seen_counts == [1, 1]
 
 
+def test_request_pacer_spaces_request_starts():
+    async def run():
+        loop = asyncio.get_running_loop()
+        pacer = _RequestPacer(0.05)
+        starts = []
+
+        async def request():
+            async with pacer:
+                starts.append(loop.time())
+
+        await asyncio.gather(*(request() for _ in range(3)))
+        return starts
+
+    starts = asyncio.run(run())
+
+    assert len(starts) == 3
+    assert starts[1] - starts[0] >= 0.045
+    assert starts[2] - starts[1] >= 0.045
+
+
+def test_dedupe_and_rank_summaries_keeps_first_and_orders_by_budget_then_photos():
+    summaries = [
+        {"source": "z", "listing_id": "1", "price": 2_000_000, "photos": ["a"]},
+        {"source": "z", "listing_id": "2", "price": 900_000, "photos": []},
+        {"source": "z", "source_listing_id": "1", "price": 800_000, "photos": []},
+        {"source": "z", "listing_id": "3", "price": 950_000, "photos": ["a", "b"]},
+        {"source": "z", "address": "No id", "photos": []},
+    ]
+
+    ranked = _dedupe_and_rank_summaries(summaries, price_max=1_000_000)
+
+    assert [s.get("listing_id") for s in ranked] == ["3", "2", "1", None]
+
+
 def test_enrich_summaries_honors_detail_call_limit(monkeypatch):
     monkeypatch.setattr(settings, "MAX_DETAIL_CALLS", 2)
     monkeypatch.setattr(settings, "INGESTION_DETAIL_CONCURRENCY", 2)
@@ -76,6 +130,78 @@ def test_enrich_summaries_honors_detail_call_limit(monkeypatch):
     assert enriched[2].get("description") is None
 
 
+def test_enrich_summaries_keeps_fetched_details_when_timeout_expires(monkeypatch):
+    monkeypatch.setattr(settings, "MAX_DETAIL_CALLS", 2)
+    monkeypatch.setattr(settings, "INGESTION_DETAIL_CONCURRENCY", 2)
+    monkeypatch.setattr(settings, "INGESTION_DETAIL_REQUEST_TIMEOUT_SECONDS", 5)
+    monkeypatch.setattr(settings, "INGESTION_DETAIL_DELAY_SECONDS", 0.0)
+
+    class _HangingDetailProvider:
+        async def get_details(self, listing_id):
+            if listing_id == "2":
+                await asyncio.sleep(10)
+            return {"description": f"listing {listing_id}"}
+
+    enrich_listings = ingestion._enrich_listings
+
+    def slow_enrich_listings(*args):
+        # CPU enrichment alone takes longer than the whole detail timeout
+        time.sleep(0.2)
+        return enrich_listings(*args)
+
+    monkeypatch.setattr(ingestion, "_enrich_listings", slow_enrich_listings)
+    summaries = [
+        {"source_listing_id": "1", "address": "A"},
+        {"source_listing_id": "2", "address": "B"},
+    ]
+
+    enriched, detail_calls_made = asyncio.run(
+        _enrich_summaries(
+            _HangingDetailProvider(),
+            "fake-source",
+            True,
+            summaries,
+            detail_timeout=0.05,
+        )
+    )
+
+    assert [item["source_listing_id"] for item in enriched] == ["1", "2"]
+    assert enriched[0]["description"] == "listing 1"
+    assert enriched[1].get("description") is None
+    assert detail_calls_made == 1
+    assert "Timeout during detail fetch (fake-source)" in ingestion_state.last_run_error
+
+
+def test_enrich_summaries_spends_capped_details_on_stale_listings_first(monkeypatch):
+    monkeypatch.setattr(settings, "MAX_DETAIL_CALLS", 2)
+    monkeypatch.setattr(settings, "INGESTION_DETAIL_CONCURRENCY", 2)
+    monkeypatch.setattr(settings, "INGESTION_DETAIL_REQUEST_TIMEOUT_SECONDS", 5)
+    monkeypatch.setattr(settings, "INGESTION_DETAIL_DELAY_SECONDS", 0.0)
+    lookups = []
+
+    def fake_recently_updated(source, since):
+        lookups.append(source)
+        return {"1"}
+
+    monkeypatch.setattr(ingestion, "recently_updated_source_ids", fake_recently_updated)
+
+    summaries = [
+        {"source_listing_id": "1", "address": "A"},
+        {"source_listing_id": "2", "address": "B"},
+        {"source_listing_id": "3", "address": "C"},
+    ]
+
+    enriched, detail_calls_made = asyncio.run(
+        _enrich_summaries(_DetailProvider(), "fake-source", True, summaries)
+    )
+
+    assert lookups == ["fake-source"]
+    assert detail_calls_made == 2
+    assert enriched[0].get("description") is None
+    assert enriched[1]["description"] == "listing 2"
+    assert enriched[2]["description"] == "listing 3"
+
+
 def test_enrich_summaries_honors_provider_specific_detail_cap(monkeypatch):
     monkeypatch.setattr(settings, "MAX_DETAIL_CALLS", 5)
     monkeypatch.setattr(settings, "INGESTION_DETAIL_CONCURRENCY", 2)
@@ -100,3 +226,107 @@ def test_enrich_summaries_honors_provider_specific_detail_cap(monkeypatch):
     assert detail_calls_made == 1
     assert enriched[0]["description"] == "listing 1"
     assert enriched[1].get("description") is None
+
+
+def test_enrich_summaries_backfills_tranquility_for_located_listings(monkeypatch):
+    monkeypatch.setattr(settings, "MAX_DETAIL_CALLS", 0)
+
+    summaries = [
+        {"source_listing_id": "1", "lat": 37.7849, "lon": -122.4399},
+        {"source_listing_id": "2", "address": "No coordinates"},
+        {"source_listing_id": "3", "lat": 37.7849, "lon": -122.4399},
+    ]
+
+    enriched, _ = asyncio.run(
+        _enrich_summaries(_DetailProvider(), "fake-source", False, summaries)
+    )
+
+    expected = calculate_tranquility_score(37.7849, -122.4399)
+    assert enriched[0]["tranquility_score"] == expected["score"]
+    assert enriched[0]["tranquility_factors"] == expected["factors"]
+    assert enriched[2]["tranquility_factors"] == expected["factors"]
+    assert "tranquility_score" not in enriched[1]
+
+
+def test_enrich_summaries_backfills_neighborhoods_from_coordinates(monkeypatch):
+    monkeypatch.setattr(settings, "MAX_DETAIL_CALLS", 0)
+
+    nopa = {"lat": 37.7800, "lon": -122.4400}
+    summaries = [
+        {"source_listing_id": "1", "neighborhood": "San Francisco", **nopa},
+        {"source_listing_id": "2", "neighborhood": "Mission", **nopa},
+        {"source_listing_id": "3", "neighborhood": "north of panhandle"},
+        {"source_listing_id": "4", "lat": 37.70, "lon": -122.50},
+    ]
+
+    enriched, _ = asyncio.run(
+        _enrich_summaries(_DetailProvider(), "fake-source", False, summaries)
+    )
+
+    assert [item.get("neighborhood") for item in enriched] == [
+        "NoPa",
+        "Mission",
+        "NoPa",
+        None,
+    ]
+
+
+def test_enrich_summaries_bounds_in_flight_detail_requests(monkeypatch):
+    monkeypatch.setattr(settings, "MAX_DETAIL_CALLS", 10)
+    monkeypatch.setattr(settings, "INGESTION_DETAIL_CONCURRENCY", 2)
+    monkeypatch.setattr(settings, "INGESTION_DETAIL_REQUEST_TIMEOUT_SECONDS", 5)
+    monkeypatch.setattr(settings, "INGESTION_DETAIL_DELAY_SECONDS", 0.0)
+
+    provider = _InFlightTrackingProvider()
+    summaries = [{"source_listing_id": str(i)} for i in range(6)]
+
+    enriched, detail_calls_made = asyncio.run(
+        _enrich_summaries(provider, "fake-source", True, summaries)
+    )
+
+    assert detail_calls_made == 6
+    assert provider.max_in_flight == 2
+    assert [item["description"] for item in enriched] == [
+        f"listing {i}" for i in range(6)
+    ]
+
+
+def test_run_ingestion_job_overlaps_providers_and_isolates_failures(monkeypatch):
+    monkeypatch.setattr(settings, "MAX_PAGES", 1)
+    released = asyncio.Event()
+
+    class _WaitingProvider:
+        async def search_page(self, page=1):
+            # Only finishes once the second provider has started fetching
+            await asyncio.wait_for(released.wait(), timeout=5)
+            return [{"listing_id": "w1"}], False
+
+    class _ReleasingProvider:
+        async def search_page(self, page=1):
+            released.set()
+            return [{"listing_id": "r1"}], False
+
+    def _broken_factory():
+        raise RuntimeError("provider misconfigured")
+
+    upsert_calls = []
+    monkeypatch.setattr(ingestion, "UPSERT_CHUNK_SIZE", 1)
+    monkeypatch.setattr(
+        ingestion,
+        "get_active_providers",
+        lambda: [
+            ProviderSpec("waiting", "Waiting", _WaitingProvider, False),
+            ProviderSpec("releasing", "Releasing", _ReleasingProvider, False),
+            ProviderSpec("broken", "Broken", _broken_factory, False),
+        ],
+    )
+    monkeypatch.setattr(ingestion, "upsert_listings", upsert_calls.append)
+    monkeypatch.setattr(ingestion, "process_listing_alerts", lambda start: {})
+
+    asyncio.run(ingestion.run_ingestion_job())
+
+    assert [len(chunk) for chunk in upsert_calls] == [1, 1]
+    upserted = [item for chunk in upsert_calls for item in chunk]
+    assert sorted(item["source_listing_id"] for item in upserted) == ["r1", "w1"]
+    assert ingestion_state.last_run_upsert_count == 2
+    assert "broken" in ingestion_state.last_run_error
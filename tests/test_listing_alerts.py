@@ -0,0 +1,53 @@
+from datetime import datetime, timedelta, timezone
+
+from app.models.listing import PropertyListing
+from app.models.listing_event import ListingEvent
+from app.services import listing_alerts
+from tests.conftest import TestingSessionLocal
+
+
+def test_price_drop_alert_flag_persists_across_runs(db_session, monkeypatch):
+    listing = PropertyListing(
+        listing_id="Z3900",
+        address="3000 Cole St, San Francisco, CA",
+        price=2200000,
+        beds=3,
+        baths=2.0,
+        sqft=1800,
+        neighborhood="Cole Valley",
+        property_type="single_family",
+        url="https://example.com/listing/Z3900",
+        description="Sunny home with natural light and a garden.",
+    )
+    db_session.add(listing)
+    db_session.flush()
+    event = ListingEvent(
+        listing_id=listing.id,
+        event_type="price_drop",
+        details={"amount": 200000, "percent": 8.0},
+    )
+    db_session.add(event)
+    db_session.commit()
+
+    sent = []
+    monkeypatch.setattr(listing_alerts, "SessionLocal", TestingSessionLocal)
+    monkeypatch.setattr(
+        listing_alerts,
+        "send_listing_alerts",
+        lambda kind, alerts: sent.append((kind, alerts)),
+    )
+    since = datetime.now(timezone.utc) - timedelta(hours=1)
+
+    listing_alerts.process_listing_alerts(since)
+    listing_alerts.process_listing_alerts(since)
+
+    immediate_ids = [
+        alert["listing_id"]
+        for kind, alerts in sent
+        if kind == "immediate"
+        for alert in alerts
+    ]
+    assert immediate_ids.count(listing.id) == 1
+    db_session.refresh(event)
+    assert event.details["alerted_immediate"] is True
+    assert event.details["percent"] == 8.0
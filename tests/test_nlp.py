@@ -0,0 +1,61 @@
+from app.services.nlp import (KEYWORDS, POSITIVE_SIGNALS, RED_FLAGS,
+                              calculate_text_quality_score, extract_flags,
+                              is_generic_description)
+
+
+def test_extract_flags_matches_overlapping_and_prefix_terms():
+    text = "Rooftop deck area with panoramic views, north-facing den and tandem parking."
+
+    flags = extract_flags(text)
+
+    text_lower = text.lower()
+    for key in ("outdoor_space", "view", "parking", "no_pets", "luxury"):
+        assert flags[key] == any(term in text_lower for term in KEYWORDS[key])
+    assert flags["view"] is True
+    assert flags["outdoor_space"] is True
+    assert flags["parking"] is True
+    assert flags["north_facing_only"] == any(
+        term in text_lower for term in RED_FLAGS["north_facing_only"]
+    )
+    assert flags["north_facing_only"] is True
+    assert flags["basement_unit"] is False
+
+
+def test_extract_flags_sets_motivated_seller_subflags():
+    assert extract_flags("Motivated seller, price reduced.") == {
+        **extract_flags(""),
+        "price_reduced": True,
+    }
+    flags = extract_flags("Back on market after the previous buyer fell through.")
+    assert flags.get("back_on_market") is True
+    assert "price_reduced" not in flags
+
+
+def test_calculate_text_quality_score_counts_each_matched_category_once():
+    text = "Sunny top floor with skylights, bay views and tandem parking. Basement storage."
+
+    text_lower = text.lower()
+    weights = {"natural_light": 10, "view": 9, "parking": 6}
+    expected = sum(
+        weights.get(key, 1)
+        for key, terms in KEYWORDS.items()
+        if any(term in text_lower for term in terms)
+    )
+    expected += 2 * sum(
+        any(term in text_lower for term in terms) for terms in POSITIVE_SIGNALS.values()
+    )
+    expected -= 5 * sum(
+        any(term in text_lower for term in terms) for terms in RED_FLAGS.values()
+    )
+    max_possible = sum(weights.values()) + len(POSITIVE_SIGNALS) * 2
+
+    score = calculate_text_quality_score(text, {"feature_weights": weights})
+
+    assert score == max(0, min(100, expected / max_possible * 100))
+    assert score > 0
+
+
+def test_is_generic_description_word_cutoff():
+    assert is_generic_description(" \n".join(["word"] * 79)) is True
+    assert is_generic_description(" \n".join(["word"] * 80)) is False
+    assert is_generic_description("word " * 10, {"light": ["sunny"], "view": ["bay"]}) is False
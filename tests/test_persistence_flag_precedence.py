@@ -1,6 +1,10 @@
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
+from app.db.session import enable_sqlite_transactions
+from app.models import Base
 from app.models.listing import PropertyListing
+from app.models.listing_event import ListingEvent
 from app.services import persistence
 
 
@@ -39,3 +43,142 @@ def test_provider_fields_not_overwritten_by_flags(db_session, monkeypatch):
     assert listing is not None
     assert listing.has_doorman_keywords is True
 
+
+def test_failed_listing_does_not_roll_back_rest_of_batch(db_session, monkeypatch):
+    test_session_local = sessionmaker(
+        bind=db_session.get_bind(), autocommit=False, autoflush=False
+    )
+    monkeypatch.setattr(persistence, "SessionLocal", test_session_local)
+
+    def _listing(listing_id, url):
+        return {
+            "source": "batchtest",
+            "source_listing_id": listing_id,
+            "url": url,
+            "address": f"{listing_id} Batch St, San Francisco, CA",
+        }
+
+    persistence.upsert_listings(
+        [
+            _listing("b1", "https://example.com/b1"),
+            # url is NOT NULL, so this row fails on flush
+            _listing("b2", None),
+            _listing("b3", "https://example.com/b3"),
+        ]
+    )
+
+    db_session.expire_all()
+    stored = {
+        listing.source_listing_id
+        for listing in db_session.query(PropertyListing).filter_by(source="batchtest")
+    }
+    assert stored == {"b1", "b3"}
+
+
+def test_repeated_listing_in_batch_updates_the_row_it_just_wrote(
+    db_session, monkeypatch
+):
+    test_session_local = sessionmaker(
+        bind=db_session.get_bind(), autocommit=False, autoflush=False
+    )
+    monkeypatch.setattr(persistence, "SessionLocal", test_session_local)
+
+    def _listing(price):
+        return {
+            "source": "dupetest",
+            "source_listing_id": "d1",
+            "url": "https://example.com/d1",
+            "address": "1 Dupe St, San Francisco, CA",
+            "price": price,
+        }
+
+    persistence.upsert_listings([_listing(1000000), _listing(900000)])
+
+    db_session.expire_all()
+    rows = db_session.query(PropertyListing).filter_by(source="dupetest").all()
+    assert len(rows) == 1
+    assert rows[0].price == 900000
+    event_types = [
+        event.event_type
+        for event in db_session.query(ListingEvent)
+        .filter_by(listing_id=rows[0].id)
+        .order_by(ListingEvent.id)
+    ]
+    assert event_types == ["new_listing", "price_drop"]
+
+
+def test_update_ignores_keys_that_are_not_listing_columns(db_session, monkeypatch):
+    test_session_local = sessionmaker(
+        bind=db_session.get_bind(), autocommit=False, autoflush=False
+    )
+    monkeypatch.setattr(persistence, "SessionLocal", test_session_local)
+
+    listing = {
+        "source": "coltest",
+        "source_listing_id": "c1",
+        "url": "https://example.com/c1",
+        "address": "1 Column St, San Francisco, CA",
+        "price": 1000000,
+    }
+    persistence.upsert_listings([listing])
+    persistence.upsert_listings(
+        [{**listing, "price": 950000, "id": 999999, "scraper_debug": "raw"}]
+    )
+
+    db_session.expire_all()
+    rows = db_session.query(PropertyListing).filter_by(source="coltest").all()
+    assert len(rows) == 1
+    assert rows[0].id != 999999
+    assert rows[0].price == 950000
+    assert not hasattr(rows[0], "scraper_debug")
+
+
+def test_sqlite_batch_commits_once_around_its_savepoints(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'batch.db'}")
+    enable_sqlite_transactions(engine)
+    Base.metadata.create_all(bind=engine)
+    statements = []
+
+    @event.listens_for(engine, "connect")
+    def trace_statements(dbapi_conn, connection_record):
+        dbapi_conn.set_trace_callback(statements.append)
+
+    engine.dispose()
+    monkeypatch.setattr(
+        persistence,
+        "SessionLocal",
+        sessionmaker(bind=engine, autocommit=False, autoflush=False),
+    )
+
+    def _listing(listing_id, url):
+        return {
+            "source": "committest",
+            "source_listing_id": listing_id,
+            "url": url,
+            "address": f"{listing_id} Commit St, San Francisco, CA",
+        }
+
+    persistence.upsert_listings(
+        [
+            _listing("t1", "https://example.com/t1"),
+            _listing("t2", None),
+            _listing("t3", "https://example.com/t3"),
+        ]
+    )
+
+    keywords = [
+        statement.split()[0].upper()
+        for statement in statements
+        if statement.split()[0].upper() in {"BEGIN", "SAVEPOINT", "COMMIT"}
+    ]
+    # Every savepoint sits inside the one batch transaction
+    assert keywords[0] == "BEGIN"
+    assert keywords.count("BEGIN") == 1
+    assert keywords.count("COMMIT") == 1
+    assert keywords[-1] == "COMMIT"
+    with engine.connect() as conn:
+        stored = conn.exec_driver_sql(
+            "SELECT source_listing_id FROM property_listings ORDER BY id"
+        ).scalars()
+        assert list(stored) == ["t1", "t3"]
+    engine.dispose()
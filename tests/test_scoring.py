@@ -1,9 +1,14 @@
+import os
 import textwrap
+from datetime import datetime
 
 from app.core.config import settings
 from app.models.listing import PropertyListing
+from app.models.listing_event import ListingEvent
+from app.services import advanced_matching
 from app.services.advanced_matching import PropertyMatcher
-from app.services.criteria_config import load_buyer_criteria
+from app.services.criteria_config import (clear_buyer_criteria_cache,
+                                          load_buyer_criteria)
 
 
 def _write_test_criteria(tmp_path):
@@ -113,13 +118,13 @@ def _configure_criteria(tmp_path):
     path = _write_test_criteria(tmp_path)
     original_path = settings.BUYER_CRITERIA_PATH
     settings.BUYER_CRITERIA_PATH = str(path)
-    load_buyer_criteria.cache_clear()
+    clear_buyer_criteria_cache()
     return original_path
 
 
 def _restore_criteria(original_path):
     settings.BUYER_CRITERIA_PATH = original_path
-    load_buyer_criteria.cache_clear()
+    clear_buyer_criteria_cache()
 
 
 def test_score_listing_rejects_hard_filters(db_session, tmp_path):
@@ -206,6 +211,58 @@ def test_score_listing_blocks_dark_without_light(db_session, tmp_path):
         _restore_criteria(original_path)
 
 
+def test_score_listings_matches_score_listing(db_session, tmp_path):
+    original_path = _configure_criteria(tmp_path)
+    try:
+        passing = PropertyListing(
+            listing_id="Z2050",
+            address="2050 Charm St, San Francisco, CA",
+            price=2200000,
+            beds=3,
+            baths=2.0,
+            sqft=1800,
+            neighborhood="Noe Valley",
+            property_type="single_family",
+            url="https://example.com/listing/Z2050",
+            description="Sunny Victorian with natural light and a chef's kitchen.",
+        )
+        failing = PropertyListing(
+            listing_id="Z2051",
+            address="2051 Demo St, San Francisco, CA",
+            price=4000000,
+            beds=3,
+            baths=2.0,
+            sqft=1700,
+            neighborhood="Noe Valley",
+            property_type="condo",
+            url="https://example.com/listing/Z2051",
+            description="Sunny home with deck.",
+        )
+        db_session.add_all([passing, failing])
+        db_session.flush()
+        db_session.add(
+            ListingEvent(
+                listing_id=passing.id,
+                event_type="price_drop",
+                details={"percent": 4},
+            )
+        )
+        db_session.commit()
+
+        matcher = PropertyMatcher(criteria=None, db=db_session)
+        scores = matcher.score_listings([passing, failing])
+
+        assert scores[failing.id] is None
+        assert round(scores[passing.id], 1) == passing.match_score
+        assert passing.why_now == "Price dropped 4% recently"
+        batch_card = dict(passing.feature_scores)
+        assert matcher.score_listing(passing, min_score_percent=scores[passing.id])
+        assert passing.feature_scores == batch_card
+        assert passing.why_now == "Price dropped 4% recently"
+    finally:
+        _restore_criteria(original_path)
+
+
 def test_outdoor_tiers_favor_private_over_weak_signal(db_session, tmp_path):
     original_path = _configure_criteria(tmp_path)
     try:
@@ -282,3 +339,74 @@ def test_score_listing_blocks_rentals_with_no_pets_signal(db_session, tmp_path):
     finally:
         settings.SEARCH_MODE = original_mode
         _restore_criteria(original_path)
+
+
+def test_load_buyer_criteria_reloads_when_file_changes(tmp_path):
+    original_path = _configure_criteria(tmp_path)
+    try:
+        first = load_buyer_criteria()
+        assert load_buyer_criteria() is first
+        assert first.hard_filters["price_max"] == 3500000
+
+        path = tmp_path / "criteria.yaml"
+        path.write_text("hard_filters:\n  price_max: 2000000\n", encoding="utf-8")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        reloaded = load_buyer_criteria()
+        assert reloaded is not first
+        assert reloaded.hard_filters["price_max"] == 2000000
+    finally:
+        _restore_criteria(original_path)
+
+
+def test_load_buyer_criteria_caches_each_path(tmp_path):
+    first_path = tmp_path / "first.yaml"
+    second_path = tmp_path / "second.yaml"
+    first_path.write_text("hard_filters:\n  price_max: 1000000\n", encoding="utf-8")
+    second_path.write_text("hard_filters:\n  price_max: 2000000\n", encoding="utf-8")
+    clear_buyer_criteria_cache()
+
+    first = load_buyer_criteria(str(first_path))
+    second = load_buyer_criteria(str(second_path))
+
+    assert load_buyer_criteria(str(first_path)) is first
+    assert load_buyer_criteria(str(second_path)) is second
+    assert second.hard_filters["price_max"] == 2000000
+    clear_buyer_criteria_cache()
+
+
+def test_latest_events_by_listing_keeps_newest_event_per_chunk(db_session, monkeypatch):
+    listings = [
+        PropertyListing(
+            listing_id=f"Z24{i:02d}",
+            address=f"24{i:02d} Event St, San Francisco, CA",
+            url=f"https://example.com/listing/Z24{i:02d}",
+        )
+        for i in range(3)
+    ]
+    db_session.add_all(listings)
+    db_session.flush()
+    older, newer = datetime(2026, 1, 1), datetime(2026, 2, 1)
+    events = [
+        ("new_listing", older),
+        ("price_drop", newer),
+        # Same timestamp as price_drop; the higher id is the newer event
+        ("back_on_market", newer),
+    ]
+    for listing in listings:
+        for event_type, created_at in events:
+            db_session.add(
+                ListingEvent(
+                    listing_id=listing.id, event_type=event_type, created_at=created_at
+                )
+            )
+    db_session.commit()
+    monkeypatch.setattr(advanced_matching, "PREFETCH_CHUNK_SIZE", 2)
+
+    latest = advanced_matching._latest_events_by_listing(
+        db_session, [listing.id for listing in listings]
+    )
+
+    assert sorted(latest) == sorted(listing.id for listing in listings)
+    assert {event.event_type for event in latest.values()} == {"back_on_market"}